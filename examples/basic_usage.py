@@ -7,6 +7,7 @@ including searching, fetching, and linking operations.
 """
 
 import os
+import sys
 from ncbi_client import NCBIClient
 
 
@@ -35,8 +36,7 @@ def main():
     
     print(f"Found {search_results['count']} articles")
     print(f"Showing first {len(search_results['id_list'])} PMIDs:")
-    for pmid in search_results['id_list']:
-        print(f"  - {pmid}")
+    sys.stdout.write(''.join(f"  - {pmid}\n" for pmid in search_results['id_list']))
     
     # Example 2: Get article summaries
     if search_results['id_list']:
@@ -46,11 +46,11 @@ def main():
             id_list=search_results['id_list'][:3]
         )
         
-        for docsum in summaries['docsums']:
-            title = docsum.get('Title', 'No title')
-            authors = docsum.get('AuthorList', 'No authors')
-            print(f"  - {title}")
-            print(f"    Authors: {authors}")
+        sys.stdout.write(''.join(
+            f"  - {docsum.get('Title', 'No title')}\n"
+            f"    Authors: {docsum.get('AuthorList', 'No authors')}\n"
+            for docsum in summaries['docsums']
+        ))
     
     # Example 3: Search nucleotide database
     print("\n3. Searching nucleotide database...")
@@ -72,11 +72,10 @@ def main():
             retmode="text"
         )
         
-        # Show first few lines of FASTA output
-        lines = sequences.split('\n')[:10]
-        for line in lines:
-            print(f"  {line}")
-        if len(sequences.split('\n')) > 10:
+        # Show first few lines of FASTA output without splitting the whole payload
+        lines = sequences.split('\n', 10)
+        sys.stdout.write(''.join(f"  {line}\n" for line in lines[:10]))
+        if len(lines) > 10:
             print("  ...")
     
     # Example 5: Find related articles
@@ -93,18 +92,17 @@ def main():
             if linkset['linksetdbs']:
                 related_ids = linkset['linksetdbs'][0]['links'][:5]
                 print(f"Found {len(related_ids)} related articles (showing first 5):")
-                for rid in related_ids:
-                    print(f"  - {rid}")
+                sys.stdout.write(''.join(f"  - {rid}\n" for rid in related_ids))
     
     # Example 6: Global search across databases
     print("\n6. Global search across all databases...")
     global_search = client.egquery.global_search("insulin")
     
     print("Database hit counts:")
-    for db_result in global_search['databases'][:10]:  # Show first 10
-        db_name = db_result['dbname']
-        count = db_result['count']
-        print(f"  {db_name}: {count:,} hits")
+    sys.stdout.write(''.join(
+        f"  {db_result['dbname']}: {db_result['count']:,} hits\n"
+        for db_result in global_search['databases'][:10]  # Show first 10
+    ))
     
     # Example 7: Get database information
     print("\n7. Getting database information...")
@@ -118,8 +116,9 @@ def main():
     # Show some search fields
     fields = db_info['fields'][:5]  # First 5 fields
     print(f"  Available search fields (showing first 5):")
-    for field in fields:
-        print(f"    - {field['name']}: {field['description']}")
+    sys.stdout.write(''.join(
+        f"    - {field['name']}: {field['description']}\n" for field in fields
+    ))
     
     print("\n" + "=" * 50)
     print("Example completed!")
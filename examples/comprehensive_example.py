@@ -11,13 +11,39 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from ncbi_client import (
-    NCBIClient, 
-    ValidationHelpers, FormatHelpers, DataHelpers,
-    SequenceTools, FormatConverter,
-    DatasetsAPI, PubChemAPI,
-    CacheManager
-)
+from ncbi_client import NCBIClient
+
+
+def iter_article_titles(xml_text):
+    """
+    Stream article titles out of a PubMed XML document.
+    
+    Uses lxml with a precompiled XPath when it is installed and falls back
+    to the standard library parser otherwise. Each Article element is
+    cleared once read, so memory stays flat for large result sets.
+    """
+    import io
+    
+    try:
+        from lxml import etree
+    except ImportError:
+        import xml.etree.ElementTree as ET
+        
+        for event, elem in ET.iterparse(io.StringIO(xml_text), events=('end',)):
+            if elem.tag == 'Article':
+                title = elem.findtext('.//ArticleTitle')
+                if title:
+                    yield title
+                elem.clear()
+        return
+    
+    article_title = etree.XPath('string(.//ArticleTitle)')
+    source = io.BytesIO(xml_text.encode('utf-8'))
+    for event, elem in etree.iterparse(source, tag='Article', huge_tree=True):
+        title = article_title(elem)
+        if title:
+            yield title
+        elem.clear()
 
 
 def main():
@@ -55,14 +81,9 @@ def main():
         print(f"Fetched details for {len(pmids)} papers")
         print("Sample paper titles:")
         
-        # Parse XML to extract titles (simplified)
-        import xml.etree.ElementTree as ET
-        root = ET.fromstring(fetch_results)
-        
-        for article in root.findall('.//Article'):
-            title_elem = article.find('.//ArticleTitle')
-            if title_elem is not None and title_elem.text:
-                print(f"- {title_elem.text[:80]}...")
+        # Stream the XML to extract titles
+        for title in iter_article_titles(fetch_results):
+            print(f"- {title[:80]}...")
     
     print("\n2. Nucleotide Database Example")
     print("-" * 30)
@@ -85,6 +106,7 @@ def main():
         print("Retrieved FASTA sequences:")
         # Parse FASTA
         from ncbi_client.parsers.fasta_parser import FASTAParser
+        from ncbi_client.converters.sequence_tools import SequenceTools
         
         fasta_records = FASTAParser.parse_string(sequences)
         for record in fasta_records[:1]:  # Show first record
@@ -99,6 +121,8 @@ def main():
     print("\n3. Sequence Analysis Example")
     print("-" * 30)
     
+    from ncbi_client.converters.sequence_tools import SequenceTools
+    
     # Example DNA sequence for analysis
     dna_sequence = "ATGAAGTGCAACATCGAGGTGAAGATCTCCTTCCGCAAGCTGAAGGACTACGAGTAG"
     
@@ -116,6 +140,8 @@ def main():
     print("\n4. Format Conversion Example")
     print("-" * 30)
     
+    from ncbi_client.converters.format_converter import FormatConverter
+    
     # Convert formats (using mock XML data)
     mock_xml = """<?xml version="1.0"?>
     <GBSet>
@@ -136,6 +162,8 @@ def main():
     print("\n5. Validation Examples")
     print("-" * 30)
     
+    from ncbi_client.utils.helpers import ValidationHelpers
+    
     # Test various validations
     test_email = "user@example.com"
     test_pmid = "12345678"
@@ -148,6 +176,8 @@ def main():
     print("\n6. Search Query Formatting")
     print("-" * 30)
     
+    from ncbi_client.utils.helpers import FormatHelpers
+    
     # Build complex search queries
     author_query = FormatHelpers.format_author_search("Smith J")
     journal_query = FormatHelpers.format_journal_search("Nature")
@@ -162,6 +192,8 @@ def main():
     print("\n7. Data Processing Examples")
     print("-" * 30)
     
+    from ncbi_client.utils.helpers import DataHelpers
+    
     # Example data processing
     sample_data = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     chunks = DataHelpers.chunk_list(sample_data, 3)
@@ -176,6 +208,8 @@ def main():
     print("-" * 30)
     
     try:
+        from ncbi_client.datasets.datasets_api import DatasetsAPI
+        
         # Initialize Datasets API
         datasets = DatasetsAPI(client)
         
@@ -198,6 +232,8 @@ def main():
     print("-" * 30)
     
     try:
+        from ncbi_client.pubchem.pubchem_api import PubChemAPI
+        
         # Initialize PubChem API
         pubchem = PubChemAPI(client)
         
@@ -216,8 +252,10 @@ def main():
     print("\n10. Caching Example")
     print("-" * 30)
     
-    # Initialize cache
-    cache = CacheManager(default_ttl=300)  # 5 minutes
+    from ncbi_client.utils.cache import MemoryCache
+    
+    # Initialize an in-memory cache sized for the working set
+    cache = MemoryCache(max_size=10_000, default_ttl=300)  # 5 minutes
     
     # Example cache usage
     cache_key = "test_data"
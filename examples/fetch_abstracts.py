@@ -10,13 +10,122 @@ This example demonstrates:
 """
 
 import sys
-import json
-import argparse
-from pathlib import Path
-from ncbi_client import NCBIClient
 
+# Everything else is imported where it is used, so `--help` and argument
+# errors return without loading the client or the XML/JSON machinery.
 
-def fetch_abstracts(query, max_results=10, output_file=None, api_key=None, email=None, verify_ssl=True):
+
+def _load_orjson():
+    """Return the orjson module, or None if it is not installed."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+# Characters of article-set XML handed to the parser at a time
+_FEED_CHUNK = 1 << 16
+
+
+def _write_if_changed(path, data):
+    """
+    Write bytes to a file only if its current contents differ.
+    
+    Leaving identical files untouched keeps their mtime stable, so
+    make-style pipelines don't redo downstream work on re-runs.
+    
+    Args:
+        path: Output file path
+        data: Encoded file contents
+        
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def iter_records(id_list, abstracts, summaries):
+    """
+    Yield one record per PMID combining its summary and abstract XML.
+    
+    Records follow the order of the article set (EFetch returns articles
+    in request order); PMIDs without an article come last, with
+    abstract_xml set to None.
+    
+    Args:
+        id_list: PubMed IDs in result order
+        abstracts: EFetch PubmedArticleSet XML
+        summaries: Parsed ESummary results
+    """
+    import xml.etree.ElementTree as ET
+    
+    summaries_by_id = {doc.get('uid'): doc for doc in summaries.get('docsums', [])}
+    seen = set()
+    
+    # The XML is fed to the parser in slices (a StringIO would copy it whole),
+    # and each article is serialized, yielded and dropped before the next one
+    # is parsed, so the parsed tree never grows past a single article
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    
+    def events():
+        for offset in range(0, len(abstracts), _FEED_CHUNK):
+            parser.feed(abstracts[offset:offset + _FEED_CHUNK])
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+    
+    root = None
+    for event, elem in events():
+        if root is None:
+            root = elem
+        if event == 'end' and elem.tag == 'PubmedArticle':
+            pmid = elem.findtext('MedlineCitation/PMID')
+            seen.add(pmid)
+            yield {
+                'pmid': pmid,
+                'summary': summaries_by_id.get(pmid),
+                'abstract_xml': ET.tostring(elem, encoding='unicode')
+            }
+            root.clear()
+    
+    for pmid in id_list:
+        if pmid not in seen:
+            yield {
+                'pmid': pmid,
+                'summary': summaries_by_id.get(pmid),
+                'abstract_xml': None
+            }
+
+
+def write_ndjson(records, stream):
+    """
+    Write records as newline-delimited JSON to a binary stream.
+    
+    Args:
+        records: Iterable of JSON-serializable records
+        stream: Binary file object to write to
+    """
+    orjson = _load_orjson()
+    if orjson is None:
+        import json
+    
+    for record in records:
+        if orjson is not None:
+            stream.write(orjson.dumps(record))
+        else:
+            stream.write(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+        stream.write(b'\n')
+
+
+def fetch_abstracts(query, max_results=10, output_file=None, api_key=None, email=None,
+                    verify_ssl=True, output_format=None):
     """
     Search PubMed and fetch abstracts for the results.
     
@@ -27,11 +136,24 @@ def fetch_abstracts(query, max_results=10, output_file=None, api_key=None, email
         api_key: Optional NCBI API key
         email: Email for identification
         verify_ssl: Whether to verify SSL certificates
+        output_format: 'json', 'ndjson', 'xml' or 'text' (default: from file suffix)
     """
+    import functools
+    from concurrent.futures import ThreadPoolExecutor
+    from pathlib import Path
+    
+    from ncbi_client import NCBIClient
+    
     # Initialize client
     client = NCBIClient(api_key=api_key, email=email, verify_ssl=verify_ssl)
     
-    print(f"Searching PubMed for: {query}")
+    # NDJSON on stdout must not be mixed with progress text
+    if output_format == 'ndjson' and not output_file:
+        log = functools.partial(print, file=sys.stderr)
+    else:
+        log = print
+    
+    log(f"Searching PubMed for: {query}")
     
     # Search for articles
     search_results = client.esearch.search(
@@ -44,26 +166,30 @@ def fetch_abstracts(query, max_results=10, output_file=None, api_key=None, email
     total_found = search_results['count']
     id_list = search_results['id_list']
     
-    print(f"Found {total_found} total results, fetching {len(id_list)} abstracts...")
+    log(f"Found {total_found} total results, fetching {len(id_list)} abstracts...")
     
     if not id_list:
-        print("No results found.")
+        log("No results found.")
         return
     
-    # Fetch abstracts
-    abstracts = client.efetch.fetch(
-        db="pubmed",
-        id_list=id_list,
-        rettype="abstract",
-        retmode="xml"
-    )
-    
-    # Also get summaries for metadata
-    summaries = client.esummary.summary(
-        db="pubmed",
-        id_list=id_list,
-        version="2.0"
-    )
+    # Fetch abstracts and summaries (for metadata) concurrently; the client's
+    # rate limiter still spaces out the two requests
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        abstracts_future = executor.submit(
+            client.efetch.fetch,
+            db="pubmed",
+            id_list=id_list,
+            rettype="abstract",
+            retmode="xml"
+        )
+        summaries_future = executor.submit(
+            client.esummary.summary,
+            db="pubmed",
+            id_list=id_list,
+            version="2.0"
+        )
+        abstracts = abstracts_future.result()
+        summaries = summaries_future.result()
     
     # Combine data
     results = {
@@ -74,47 +200,80 @@ def fetch_abstracts(query, max_results=10, output_file=None, api_key=None, email
         'summaries': summaries
     }
     
+    # Pick the output format from the flag or the file suffix
+    if output_format is None and output_file:
+        suffix = Path(output_file).suffix.lower()
+        output_format = {
+            '.json': 'json',
+            '.ndjson': 'ndjson',
+            '.jsonl': 'ndjson',
+            '.xml': 'xml'
+        }.get(suffix, 'text')
+    
     # Save or print results
-    if output_file:
+    if output_format == 'ndjson':
+        # One record per article keeps memory flat for large result sets
+        records = iter_records(id_list, abstracts, summaries)
+        if output_file:
+            with open(output_file, 'wb', buffering=1 << 20) as f:
+                write_ndjson(records, f)
+            print(f"Results saved to {output_file}")
+        else:
+            sys.stdout.flush()
+            write_ndjson(records, sys.stdout.buffer)
+            
+    elif output_file:
         output_path = Path(output_file)
         
-        if output_path.suffix.lower() == '.json':
-            # Save as JSON
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-            print(f"Results saved to {output_path}")
+        if output_format == 'json':
+            # Save as JSON, using orjson when it is installed
+            orjson = _load_orjson()
+            if orjson is not None:
+                data = orjson.dumps(results, option=orjson.OPT_INDENT_2)
+            else:
+                import json
+                data = json.dumps(results, indent=2, ensure_ascii=False).encode('utf-8')
             
-        elif output_path.suffix.lower() == '.xml':
+            if _write_if_changed(output_path, data):
+                print(f"Results saved to {output_path}")
+            else:
+                print(f"{output_path} is already up to date")
+            
+        elif output_format == 'xml':
             # Save just the XML abstracts
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(abstracts)
-            print(f"Abstract XML saved to {output_path}")
+            if _write_if_changed(output_path, abstracts.encode('utf-8')):
+                print(f"Abstract XML saved to {output_path}")
+            else:
+                print(f"{output_path} is already up to date")
             
         else:
-            # Save as text summary
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(f"Search Query: {query}\n")
-                f.write(f"Total Found: {total_found}\n")
-                f.write(f"Retrieved: {len(id_list)}\n\n")
-                
-                f.write("Article IDs:\n")
-                for pmid in id_list:
-                    f.write(f"  PMID:{pmid}\n")
-                
-                f.write(f"\nFull XML abstracts:\n{abstracts}\n")
-            print(f"Results saved to {output_path}")
+            # Save as text summary, encoded once and written in one call
+            text = ''.join([
+                f"Search Query: {query}\n",
+                f"Total Found: {total_found}\n",
+                f"Retrieved: {len(id_list)}\n\n",
+                "Article IDs:\n",
+                ''.join(f"  PMID:{pmid}\n" for pmid in id_list),
+                f"\nFull XML abstracts:\n{abstracts}\n"
+            ])
+            
+            if _write_if_changed(output_path, text.encode('utf-8')):
+                print(f"Results saved to {output_path}")
+            else:
+                print(f"{output_path} is already up to date")
     else:
         # Print summary to stdout
         print(f"\nResults for '{query}':")
         print(f"Total articles found: {total_found}")
         print(f"Retrieved: {len(id_list)}")
         print("\nPubMed IDs:")
-        for pmid in id_list:
-            print(f"  PMID:{pmid}")
+        print('\n'.join(f"  PMID:{pmid}" for pmid in id_list))
 
 
 def main():
     """Main entry point."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Fetch PubMed abstracts for a search query',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -122,6 +281,7 @@ def main():
 Examples:
   python fetch_abstracts.py "COVID-19 vaccine" --max-results 20
   python fetch_abstracts.py "machine learning" --output ml_abstracts.json
+  python fetch_abstracts.py "cancer" --max-results 500 --output cancer.ndjson
   python fetch_abstracts.py "CRISPR" --max-results 50 --output crispr.xml --api-key YOUR_KEY
         '''
     )
@@ -129,7 +289,9 @@ Examples:
     parser.add_argument('query', help='Search query for PubMed')
     parser.add_argument('--max-results', type=int, default=10,
                        help='Maximum number of results to fetch (default: 10)')
-    parser.add_argument('--output', '-o', help='Output file (JSON, XML, or text)')
+    parser.add_argument('--output', '-o', help='Output file (JSON, NDJSON, XML, or text)')
+    parser.add_argument('--format', choices=['json', 'ndjson', 'xml', 'text'],
+                       help='Output format (default: inferred from --output suffix)')
     parser.add_argument('--api-key', help='NCBI API key for higher rate limits')
     parser.add_argument('--email', help='Email address for identification')
     parser.add_argument('--no-ssl-verify', action='store_true',
@@ -144,7 +306,8 @@ Examples:
             output_file=args.output,
             api_key=args.api_key,
             email=args.email,
-            verify_ssl=not args.no_ssl_verify
+            verify_ssl=not args.no_ssl_verify,
+            output_format=args.format
         )
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -9,16 +9,32 @@ Python standard library, suitable for integration into scripts.
 import sys
 import json
 import argparse
-from ncbi_client import NCBIClient
+import functools
+
+try:
+    import orjson
+except ImportError:  # optional; the standard library encoder is used instead
+    orjson = None
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key, email, verify_ssl):
+    """Return a shared NCBIClient for these credentials."""
+    # Imported here so --help does not load the client package
+    from ncbi_client import NCBIClient
+    return NCBIClient(api_key=api_key, email=email, verify_ssl=verify_ssl)
+
+
+def _dumps(obj) -> str:
+    """Serialize results as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2)
 
 
 def search_command(args):
     """Execute search command."""
-    client = NCBIClient(
-        api_key=args.api_key, 
-        email=args.email,
-        verify_ssl=args.ssl_verify
-    )
+    client = _get_client(args.api_key, args.email, args.ssl_verify)
     
     print(f"Searching {args.database} for: {args.query}")
     
@@ -30,28 +46,23 @@ def search_command(args):
     )
     
     if args.format == 'json':
-        print(json.dumps(results, indent=2))
+        print(_dumps(results))
     elif args.format == 'ids':
-        for uid in results['id_list']:
-            print(uid)
+        sys.stdout.writelines(uid + '\n' for uid in results['id_list'])
     elif args.format == 'count':
         print(results['count'])
     else:
         print(f"Found {results['count']} results:")
-        for uid in results['id_list']:
-            print(f"  {uid}")
+        sys.stdout.writelines(f"  {uid}\n" for uid in results['id_list'])
 
 
 def fetch_command(args):
     """Execute fetch command."""
-    client = NCBIClient(
-        api_key=args.api_key, 
-        email=args.email,
-        verify_ssl=args.ssl_verify
-    )
+    client = _get_client(args.api_key, args.email, args.ssl_verify)
     
     # Parse comma-separated IDs
-    id_list = [id.strip() for id in args.ids.split(',')]
+    from ncbi_client.utils import DataHelpers
+    id_list = DataHelpers.parse_id_list(args.ids)
     
     print(f"Fetching {len(id_list)} records from {args.database}")
     
@@ -67,14 +78,11 @@ def fetch_command(args):
 
 def summary_command(args):
     """Execute summary command."""
-    client = NCBIClient(
-        api_key=args.api_key, 
-        email=args.email,
-        verify_ssl=args.ssl_verify
-    )
+    client = _get_client(args.api_key, args.email, args.ssl_verify)
     
     # Parse comma-separated IDs
-    id_list = [id.strip() for id in args.ids.split(',')]
+    from ncbi_client.utils import DataHelpers
+    id_list = DataHelpers.parse_id_list(args.ids)
     
     print(f"Getting summaries for {len(id_list)} records from {args.database}")
     
@@ -84,29 +92,23 @@ def summary_command(args):
         version=args.version
     )
     
-    print(json.dumps(results, indent=2))
+    print(_dumps(results))
 
 
 def info_command(args):
     """Execute info command."""
-    client = NCBIClient(
-        api_key=args.api_key, 
-        email=args.email,
-        verify_ssl=args.ssl_verify
-    )
+    client = _get_client(args.api_key, args.email, args.ssl_verify)
     
     if args.list_only:
         databases = client.einfo.get_databases()
-        for db in databases:
-            print(db)
+        sys.stdout.writelines(db + '\n' for db in databases)
     elif args.database:
         db_info = client.einfo.get_database_info(args.database)
-        print(json.dumps(db_info, indent=2))
+        print(_dumps(db_info))
     else:
         print("Available databases:")
         databases = client.einfo.get_databases()
-        for db in databases:
-            print(f"  {db}")
+        sys.stdout.writelines(f"  {db}\n" for db in databases)
 
 
 def main():
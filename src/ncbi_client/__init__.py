@@ -4,30 +4,103 @@ NCBI E-utilities Python client.
 A comprehensive Python client for accessing NCBI databases through the E-utilities API.
 """
 
-from ncbi_client.core.base_client import NCBIClient
-from ncbi_client.core.exceptions import NCBIError, AuthenticationError, RateLimitError, APIError
-from ncbi_client.core.rate_limiter import RateLimiter
-
-# E-utilities
-from ncbi_client.eutils import (
-    ESearch, EFetch, EPost, ESummary, ELink, 
-    EInfo, EGQuery, ESpell, ECitMatch
-)
-
-# Parsers and converters
-from ncbi_client.parsers import XMLParser, JSONParser, FASTAParser, GenBankParser
-from ncbi_client.converters import FormatConverter, SequenceTools
-
-# Additional APIs
-from ncbi_client.datasets import DatasetsAPI, GenomeAssembly, Gene
-from ncbi_client.pubchem import PubChemAPI, Compound, Assay
-
-# Utilities
-from ncbi_client.utils import (
-    HistoryManager, CacheManager, SQLiteCache, MemoryCache,
-    ValidationHelpers, FormatHelpers, XMLHelpers, URLHelpers, 
-    DataHelpers, DateHelpers, ErrorHelpers
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ncbi_client.core.base_client import NCBIClient
+    from ncbi_client.core.exceptions import NCBIError, AuthenticationError, RateLimitError, APIError
+    from ncbi_client.core.rate_limiter import RateLimiter
+    
+    # E-utilities
+    from ncbi_client.eutils import (
+        ESearch, EFetch, EPost, ESummary, ELink, 
+        EInfo, EGQuery, ESpell, ECitMatch
+    )
+    
+    # Parsers and converters
+    from ncbi_client.parsers import XMLParser, JSONParser, FASTAParser, GenBankParser
+    from ncbi_client.converters import FormatConverter, SequenceTools
+    
+    # Additional APIs
+    from ncbi_client.datasets import DatasetsAPI, GenomeAssembly, Gene
+    from ncbi_client.pubchem import PubChemAPI, Compound, Assay
+    
+    # Utilities
+    from ncbi_client.utils import (
+        HistoryManager, CacheManager, SQLiteCache, MemoryCache,
+        ValidationHelpers, FormatHelpers, XMLHelpers, URLHelpers, 
+        DataHelpers, DateHelpers, ErrorHelpers
+    )
+
+# Public names and the module each is re-exported from. Submodules are only
+# imported on first attribute access (PEP 562), so ``import ncbi_client`` stays
+# cheap for callers that need a single class.
+_LAZY_IMPORTS = {
+    # Core
+    'NCBIClient': 'ncbi_client.core.base_client',
+    'NCBIError': 'ncbi_client.core.exceptions',
+    'AuthenticationError': 'ncbi_client.core.exceptions',
+    'RateLimitError': 'ncbi_client.core.exceptions',
+    'APIError': 'ncbi_client.core.exceptions',
+    'RateLimiter': 'ncbi_client.core.rate_limiter',
+    
+    # E-utilities
+    'ESearch': 'ncbi_client.eutils',
+    'EFetch': 'ncbi_client.eutils',
+    'EPost': 'ncbi_client.eutils',
+    'ESummary': 'ncbi_client.eutils',
+    'ELink': 'ncbi_client.eutils',
+    'EInfo': 'ncbi_client.eutils',
+    'EGQuery': 'ncbi_client.eutils',
+    'ESpell': 'ncbi_client.eutils',
+    'ECitMatch': 'ncbi_client.eutils',
+    
+    # Parsers and converters
+    'XMLParser': 'ncbi_client.parsers',
+    'JSONParser': 'ncbi_client.parsers',
+    'FASTAParser': 'ncbi_client.parsers',
+    'GenBankParser': 'ncbi_client.parsers',
+    'FormatConverter': 'ncbi_client.converters',
+    'SequenceTools': 'ncbi_client.converters',
+    
+    # Additional APIs
+    'DatasetsAPI': 'ncbi_client.datasets',
+    'GenomeAssembly': 'ncbi_client.datasets',
+    'Gene': 'ncbi_client.datasets',
+    'PubChemAPI': 'ncbi_client.pubchem',
+    'Compound': 'ncbi_client.pubchem',
+    'Assay': 'ncbi_client.pubchem',
+    
+    # Utilities
+    'HistoryManager': 'ncbi_client.utils',
+    'CacheManager': 'ncbi_client.utils',
+    'SQLiteCache': 'ncbi_client.utils',
+    'MemoryCache': 'ncbi_client.utils',
+    'ValidationHelpers': 'ncbi_client.utils',
+    'FormatHelpers': 'ncbi_client.utils',
+    'XMLHelpers': 'ncbi_client.utils',
+    'URLHelpers': 'ncbi_client.utils',
+    'DataHelpers': 'ncbi_client.utils',
+    'DateHelpers': 'ncbi_client.utils',
+    'ErrorHelpers': 'ncbi_client.utils',
+}
+
+
+def __getattr__(name):
+    """Import a public name from its submodule on first access."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __version__ = "1.0.0"
 
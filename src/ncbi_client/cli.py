@@ -7,12 +7,141 @@ Provides basic CLI functionality for common E-utilities operations.
 import os
 import json
 import sys
-from typing import Optional
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Union
 
 import click
 
 from ncbi_client import NCBIClient
 from ncbi_client.core.exceptions import NCBIError
+from ncbi_client.utils.cache import SQLiteCache
+from ncbi_client.utils.helpers import DataHelpers
+
+try:
+    import orjson
+except ImportError:  # optional; the standard library encoder is used instead
+    orjson = None
+
+# Sequence records are immutable for a given accession.version, so fetched
+# payloads may be kept much longer than search/summary results.
+FETCH_CACHE_TTL = 7 * 24 * 3600
+_WRITE_CHUNK = 1 << 20
+
+
+def _dumps(obj) -> str:
+    """Serialize results as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _write_output(path: str, data: Union[str, bytes]) -> None:
+    """
+    Write command output to a file in 1 MiB os.write calls.
+    
+    Skips the buffered text layer, which only adds copies for output that
+    is already fully built in memory.
+    
+    Args:
+        path: Output file path
+        data: Text (written as UTF-8) or bytes
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    
+    view = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        offset = 0
+        while offset < len(view):
+            offset += os.write(fd, view[offset:offset + _WRITE_CHUNK])
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cache() -> SQLiteCache:
+    """Return the shared on-disk response cache."""
+    return SQLiteCache()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: Optional[str], email: Optional[str], tool: str,
+                verify_ssl: bool) -> NCBIClient:
+    """Return a shared NCBIClient so commands in one process reuse its connection setup."""
+    return NCBIClient(api_key=api_key, email=email, tool=tool, verify_ssl=verify_ssl)
+
+
+def _cached_call(ctx, endpoint: str, params: dict, call: Callable[[], Any],
+                 ttl: Optional[int] = None) -> Any:
+    """
+    Run an E-utilities call through the on-disk response cache when enabled.
+    
+    Args:
+        ctx: Click context holding the caching flag
+        endpoint: Endpoint name used as part of the cache key
+        params: Request parameters used as part of the cache key
+        call: Zero-argument callable performing the request
+        ttl: Time-to-live in seconds (cache default if None)
+        
+    Returns:
+        Cached or freshly fetched result
+    """
+    if not ctx.obj['cache']:
+        return call()
+    
+    cache = _get_cache()
+    results = cache.get(endpoint, params)
+    if results is None:
+        results = call()
+        cache.set(endpoint, results, params, ttl=ttl)
+    return results
+
+
+def _run_batched(call: Callable[[List[str]], Any], id_list: List[str],
+                 batch_size: Optional[int], concurrency: int) -> List[Any]:
+    """
+    Split an ID list into batches and run them with bounded concurrency.
+    
+    Requests still pass through the client's shared rate limiter, so
+    concurrency only fills the per-second budget instead of exceeding it.
+    
+    Args:
+        call: Callable performing one request for a batch of IDs
+        id_list: IDs to process
+        batch_size: IDs per request (all IDs in one request if None)
+        concurrency: Maximum number of requests in flight
+        
+    Returns:
+        Per-batch results in batch order
+    """
+    if not batch_size or batch_size >= len(id_list):
+        return [call(id_list)]
+    
+    batches = [id_list[i:i + batch_size] for i in range(0, len(id_list), batch_size)]
+    if concurrency <= 1:
+        return [call(batch) for batch in batches]
+    
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as executor:
+        return list(executor.map(call, batches))
+
+
+def _merge_batches(batch_results: List[dict]) -> dict:
+    """
+    Merge per-batch results in batch order.
+    
+    List fields are concatenated, other fields are taken from the first
+    batch that has them.
+    """
+    merged: dict = {}
+    for batch in batch_results:
+        for key, value in batch.items():
+            if key not in merged:
+                merged[key] = list(value) if isinstance(value, list) else value
+            elif isinstance(value, list) and isinstance(merged[key], list):
+                merged[key].extend(value)
+    return merged
 
 
 @click.group()
@@ -21,16 +150,22 @@ from ncbi_client.core.exceptions import NCBIError
 @click.option('--tool', default='ncbi-client-cli', help='Tool name for identification')
 @click.option('--no-ssl-verify', is_flag=True, help='Disable SSL certificate verification')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+@click.option('--cache/--no-cache', default=False,
+              help='Cache search, summary, link and info responses on disk')
+@click.option('--cache-fetch', is_flag=True,
+              help='Also cache fetched records (implies --cache)')
 @click.pass_context
-def cli(ctx, api_key: Optional[str], email: Optional[str], tool: str, no_ssl_verify: bool, verbose: bool):
+def cli(ctx, api_key: Optional[str], email: Optional[str], tool: str, no_ssl_verify: bool, verbose: bool,
+        cache: bool, cache_fetch: bool):
     """NCBI Client command-line interface."""
     ctx.ensure_object(dict)
-    ctx.obj['client'] = NCBIClient(
-        api_key=api_key, 
-        email=email, 
-        tool=tool,
-        verify_ssl=not no_ssl_verify
+    # Client and cache are built on first use, so --help and argument errors
+    # never construct them
+    ctx.obj['get_client'] = functools.partial(
+        _get_client, api_key, email, tool, not no_ssl_verify
     )
+    ctx.obj['cache'] = cache or cache_fetch
+    ctx.obj['cache_fetch'] = cache_fetch
     ctx.obj['verbose'] = verbose
 
 
@@ -49,22 +184,19 @@ def search(ctx, database: str, query: str, retmax: int, retstart: int,
            sort: Optional[str], output: Optional[str], output_format: str):
     """Search an NCBI database."""
     try:
-        client = ctx.obj['client']
+        client = ctx.obj['get_client']()
         
         if ctx.obj['verbose']:
             click.echo(f"Searching {database} for: {query}")
         
-        results = client.esearch.search(
-            db=database,
-            term=query,
-            retmax=retmax,
-            retstart=retstart,
-            sort=sort
-        )
+        params = {'db': database, 'term': query, 'retmax': retmax,
+                  'retstart': retstart, 'sort': sort}
+        results = _cached_call(ctx, 'esearch', params,
+                               lambda: client.esearch.search(**params))
         
         # Format output
         if output_format == 'json':
-            output_text = json.dumps(results, indent=2)
+            output_text = _dumps(results)
         elif output_format == 'ids':
             output_text = '\n'.join(results['id_list'])
         elif output_format == 'count':
@@ -72,8 +204,7 @@ def search(ctx, database: str, query: str, retmax: int, retstart: int,
         
         # Write output
         if output:
-            with open(output, 'w') as f:
-                f.write(output_text)
+            _write_output(output, output_text)
             if ctx.obj['verbose']:
                 click.echo(f"Results written to {output}")
         else:
@@ -90,30 +221,43 @@ def search(ctx, database: str, query: str, retmax: int, retstart: int,
 @click.option('--rettype', default='docsum', help='Retrieval type')
 @click.option('--retmode', default='xml', help='Retrieval mode')
 @click.option('--output', '-o', help='Output file (default: stdout)')
+@click.option('--batch-size', type=click.IntRange(min=1), help='IDs per request (--retmode text only)')
+@click.option('--concurrency', default=3, type=click.IntRange(min=1),
+              help='Concurrent requests when batching')
 @click.pass_context
 def fetch(ctx, database: str, ids: str, rettype: str, retmode: str, 
-          output: Optional[str]):
+          output: Optional[str], batch_size: Optional[int], concurrency: int):
     """Fetch records from an NCBI database."""
     try:
-        client = ctx.obj['client']
+        client = ctx.obj['get_client']()
         
         # Parse IDs
-        id_list = [id.strip() for id in ids.split(',')]
+        id_list = DataHelpers.parse_id_list(ids)
+        
+        # Text records can be concatenated, but XML/ASN.1 documents can't:
+        # each batch would add its own declaration and root element
+        if batch_size and batch_size < len(id_list) and retmode != 'text':
+            raise click.BadParameter(
+                "batching requires --retmode text", param_hint="'--batch-size'"
+            )
         
         if ctx.obj['verbose']:
             click.echo(f"Fetching {len(id_list)} records from {database}")
         
-        results = client.efetch.fetch(
-            db=database,
-            id_list=id_list,
-            rettype=rettype,
-            retmode=retmode
-        )
+        def fetch_batch(batch: List[str]) -> str:
+            params = {'db': database, 'id_list': batch, 'rettype': rettype,
+                      'retmode': retmode}
+            if ctx.obj['cache_fetch']:
+                return _cached_call(ctx, 'efetch', params,
+                                    lambda: client.efetch.fetch(**params),
+                                    ttl=FETCH_CACHE_TTL)
+            return client.efetch.fetch(**params)
+        
+        results = ''.join(_run_batched(fetch_batch, id_list, batch_size, concurrency))
         
         # Write output
         if output:
-            with open(output, 'w') as f:
-                f.write(results)
+            _write_output(output, results)
             if ctx.obj['verbose']:
                 click.echo(f"Results written to {output}")
         else:
@@ -130,30 +274,35 @@ def fetch(ctx, database: str, ids: str, rettype: str, retmode: str,
 @click.option('--version', default='1.0', type=click.Choice(['1.0', '2.0']),
               help='ESummary version')
 @click.option('--output', '-o', help='Output file (default: stdout)')
+@click.option('--batch-size', type=click.IntRange(min=1), help='IDs per request')
+@click.option('--concurrency', default=3, type=click.IntRange(min=1),
+              help='Concurrent requests when batching')
 @click.pass_context
-def summary(ctx, database: str, ids: str, version: str, output: Optional[str]):
+def summary(ctx, database: str, ids: str, version: str, output: Optional[str],
+            batch_size: Optional[int], concurrency: int):
     """Get document summaries from an NCBI database."""
     try:
-        client = ctx.obj['client']
+        client = ctx.obj['get_client']()
         
         # Parse IDs
-        id_list = [id.strip() for id in ids.split(',')]
+        id_list = DataHelpers.parse_id_list(ids)
         
         if ctx.obj['verbose']:
             click.echo(f"Getting summaries for {len(id_list)} records from {database}")
         
-        results = client.esummary.summary(
-            db=database,
-            id_list=id_list,
-            version=version
-        )
+        def summary_batch(batch: List[str]) -> dict:
+            params = {'db': database, 'id_list': batch, 'version': version}
+            return _cached_call(ctx, 'esummary', params,
+                                lambda: client.esummary.summary(**params))
+        
+        batch_results = _run_batched(summary_batch, id_list, batch_size, concurrency)
+        results = batch_results[0] if len(batch_results) == 1 else _merge_batches(batch_results)
         
-        output_text = json.dumps(results, indent=2)
+        output_text = _dumps(results)
         
         # Write output
         if output:
-            with open(output, 'w') as f:
-                f.write(output_text)
+            _write_output(output, output_text)
             if ctx.obj['verbose']:
                 click.echo(f"Results written to {output}")
         else:
@@ -174,27 +323,23 @@ def summary(ctx, database: str, ids: str, version: str, output: Optional[str]):
 def link(ctx, dbfrom: str, dbto: str, ids: str, cmd: str, output: Optional[str]):
     """Find links between NCBI databases."""
     try:
-        client = ctx.obj['client']
+        client = ctx.obj['get_client']()
         
         # Parse IDs
-        id_list = [id.strip() for id in ids.split(',')]
+        id_list = DataHelpers.parse_id_list(ids)
         
         if ctx.obj['verbose']:
             click.echo(f"Finding links from {dbfrom} to {dbto}")
         
-        results = client.elink.link(
-            dbfrom=dbfrom,
-            db=dbto,
-            id_list=id_list,
-            cmd=cmd
-        )
+        params = {'dbfrom': dbfrom, 'db': dbto, 'id_list': id_list, 'cmd': cmd}
+        results = _cached_call(ctx, 'elink', params,
+                               lambda: client.elink.link(**params))
         
-        output_text = json.dumps(results, indent=2)
+        output_text = _dumps(results)
         
         # Write output
         if output:
-            with open(output, 'w') as f:
-                f.write(output_text)
+            _write_output(output, output_text)
             if ctx.obj['verbose']:
                 click.echo(f"Results written to {output}")
         else:
@@ -212,15 +357,17 @@ def link(ctx, dbfrom: str, dbto: str, ids: str, cmd: str, output: Optional[str])
 def info(ctx, database: Optional[str], list_only: bool):
     """Get database information."""
     try:
-        client = ctx.obj['client']
+        client = ctx.obj['get_client']()
         
         if list_only or not database:
-            databases = client.einfo.get_databases()
-            for db in databases:
-                click.echo(db)
+            databases = _cached_call(ctx, 'einfo', {},
+                                     client.einfo.get_databases)
+            if databases:
+                click.echo('\n'.join(databases))
         else:
-            db_info = client.einfo.get_database_info(database)
-            output_text = json.dumps(db_info, indent=2)
+            db_info = _cached_call(ctx, 'einfo', {'db': database},
+                                   lambda: client.einfo.get_database_info(database))
+            output_text = _dumps(db_info)
             click.echo(output_text)
             
     except NCBIError as e:
@@ -235,18 +382,18 @@ def info(ctx, database: Optional[str], list_only: bool):
 def global_search(ctx, query: str, output: Optional[str]):
     """Perform global search across all NCBI databases."""
     try:
-        client = ctx.obj['client']
+        client = ctx.obj['get_client']()
         
         if ctx.obj['verbose']:
             click.echo(f"Global search for: {query}")
         
-        results = client.egquery.global_search(query)
-        output_text = json.dumps(results, indent=2)
+        results = _cached_call(ctx, 'egquery', {'term': query},
+                               lambda: client.egquery.global_search(query))
+        output_text = _dumps(results)
         
         # Write output
         if output:
-            with open(output, 'w') as f:
-                f.write(output_text)
+            _write_output(output, output_text)
             if ctx.obj['verbose']:
                 click.echo(f"Results written to {output}")
         else:
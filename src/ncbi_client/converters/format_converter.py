@@ -4,11 +4,211 @@ Format conversion utilities for biological data.
 Provides conversion between different biological data formats.
 """
 
-from typing import List, Dict, Any, Optional
+import io
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Iterator, Sequence, Union
 from ncbi_client.parsers.fasta_parser import FASTARecord, FASTAParser
 from ncbi_client.parsers.genbank_parser import GenBankRecord, GenBankParser
-from ncbi_client.parsers.xml_parser import XMLParser
-from ncbi_client.core.exceptions import ParseError
+from ncbi_client.core.exceptions import ParseError, ValidationError
+
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional; fall back to the standard library
+    etree = None
+    import xml.etree.ElementTree as ET
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional (installed with the 'data' extra)
+    np = None
+
+# Fixed-width sequence wrapping, done by the regex engine rather than a slice loop
+_WRAP70 = re.compile(r'(.{70})', re.S)
+_WRAP80 = re.compile(r'(.{80})', re.S)
+
+# Leading-character checks and the GenBank keyword scan of detect_format in one
+# match. The scan is bounded to 1000 characters, so a single regex pass is as
+# cheap as a dedicated multi-pattern automaton would be here.
+_LEADING_WS = re.compile(r'\s*')
+_LEADING_WS_BYTES = re.compile(rb'\s*')
+_FORMAT_RE = re.compile(
+    r'(?:(?P<fasta>>)|(?P<xml><)|LOCUS|'
+    r'.*?(?:DEFINITION|ACCESSION|VERSION|SOURCE|FEATURES|ORIGIN))',
+    re.S
+)
+
+
+def _joined_value(buffer: io.StringIO) -> str:
+    """
+    Return buffer contents as if the written lines had been newline-joined.
+    
+    Writers terminate every line with a newline; dropping the final one in
+    place keeps output identical to the join without copying the buffer.
+    """
+    end = buffer.tell()
+    if end:
+        buffer.truncate(end - 1)
+    return buffer.getvalue()
+
+
+# Single-record fast path of xml_to_fasta: one pattern per GBSeq child it needs
+_SINGLE_GBSEQ_TAGS = {
+    'accession': 'GBSeq_primary-accession',
+    'accession_version': 'GBSeq_accession-version',
+    'definition': 'GBSeq_definition',
+    'sequence': 'GBSeq_sequence',
+}
+_SINGLE_GBSEQ_PATTERNS = {
+    name: re.compile(f'<{tag}>([^<]*)</{tag}>') for name, tag in _SINGLE_GBSEQ_TAGS.items()
+}
+# Markup whose text an XML parser would rewrite (entities, CDATA, comments, CRs)
+_SINGLE_GBSEQ_UNSAFE = ('&', '<![CDATA[', '<!--', '\r')
+
+# Header written by fasta_to_genbank_minimal for each record
+_GB_HEADER_TMPL = (
+    "LOCUS       {accession:<16} {length:>8} bp    DNA     linear   UNK 01-JAN-1980\n"
+    "DEFINITION  {definition}\n"
+    "ACCESSION   {accession}\n"
+    "VERSION     {accession}.1\n"
+    "KEYWORDS    .\n"
+    "SOURCE      {organism}\n"
+    "  ORGANISM  {organism}\n"
+    "            Unclassified.\n"
+    "FEATURES             Location/Qualifiers\n"
+    "     source          1..{length}\n"
+    "                     /organism=\"{organism}\"\n"
+    "ORIGIN      \n"
+)
+
+# GBSeq child element read for each field _iter_genbank_xml can project
+_GBSEQ_FIELDS = {
+    'accession': 'GBSeq_primary-accession',
+    'definition': 'GBSeq_definition',
+    'organism': 'GBSeq_organism',
+    'length': 'GBSeq_length',
+    'sequence': 'GBSeq_sequence',
+}
+
+
+# Sequences with fewer full ORIGIN lines than this are formatted in pure Python
+_NUMPY_MIN_LINES = 100
+
+# Below this many records a process pool costs more than it saves
+_PARALLEL_MIN_RECORDS = 500
+
+
+def _origin_lines_numpy(sequence: str, full_lines: int) -> str:
+    """
+    Format the first full_lines complete 60-nt ORIGIN lines with NumPy.
+    
+    Each line is 76 bytes: a right-aligned 9-digit position, a space, six
+    space-separated 10-nt groups and a newline, built with array writes.
+    """
+    seq = np.frombuffer(sequence.encode('ascii'), dtype=np.uint8, count=full_lines * 60)
+    out = np.full((full_lines, 76), ord(' '), dtype=np.uint8)
+    
+    # Right-aligned line start positions, one digit column at a time
+    positions = np.arange(full_lines, dtype=np.int64) * 60 + 1
+    for column in range(9):
+        place = 10 ** (8 - column)
+        digits = (positions // place) % 10 + ord('0')
+        out[:, column] = np.where(positions >= place, digits, ord(' '))
+    
+    # Columns 10-75 hold six 11-byte slots: ten bases plus a separator
+    groups = out[:, 10:].reshape(full_lines, 6, 11)
+    groups[:, :, :10] = seq.reshape(full_lines, 6, 10)
+    out[:, 75] = ord('\n')
+    
+    return out.tobytes().decode('ascii')
+
+
+def _write_origin(buffer: io.StringIO, sequence: str) -> None:
+    """Write the numbered ORIGIN lines of a GenBank record."""
+    start = 0
+    full_lines = len(sequence) // 60
+    # Positions must fit the 9-character column for the fixed-width layout
+    if (np is not None and full_lines >= _NUMPY_MIN_LINES
+            and full_lines * 60 < 10 ** 9 and sequence.isascii()):
+        buffer.write(_origin_lines_numpy(sequence, full_lines))
+        start = full_lines * 60
+    
+    # Format sequence in groups of 10
+    for line_start in range(start, full_lines * 60, 60):
+        line = sequence[line_start:line_start + 60]
+        buffer.write(f"{line_start + 1:>9} {line[:10]} {line[10:20]} {line[20:30]} "
+                     f"{line[30:40]} {line[40:50]} {line[50:]}\n")
+    
+    tail_start = full_lines * 60
+    if tail_start < len(sequence):
+        tail = sequence[tail_start:]
+        formatted_seq = ' '.join([tail[j:j+10] for j in range(0, len(tail), 10)])
+        buffer.write(f"{tail_start + 1:>9} {formatted_seq}\n")
+
+
+def _single_gbseq_record(xml_content: str) -> Optional[Dict[str, Any]]:
+    """
+    Read accession, definition and sequence of a one-record GBSet with regexes.
+    
+    Only plain documents qualify: exactly one GBSeq, a closing GBSet, and no
+    markup whose text a parser would transform. Returns None otherwise so the
+    caller can fall back to the XML parser. The rest of the document is not
+    validated.
+    """
+    if not xml_content.rstrip().endswith('</GBSet>'):
+        return None
+    if xml_content.count('<GBSeq>') != 1 or xml_content.count('</GBSeq>') != 1:
+        return None
+    if any(marker in xml_content for marker in _SINGLE_GBSEQ_UNSAFE):
+        return None
+    
+    start = xml_content.index('<GBSeq>')
+    end = xml_content.index('</GBSeq>')
+    if end < start:
+        return None
+    
+    fields = {}
+    for name, pattern in _SINGLE_GBSEQ_PATTERNS.items():
+        match = pattern.search(xml_content, start, end)
+        if match is None:
+            if xml_content.find('<' + _SINGLE_GBSEQ_TAGS[name], start, end) != -1:
+                # Present in a form the pattern does not cover (attributes, self-closing)
+                return None
+            fields[name] = None
+        else:
+            fields[name] = match.group(1)
+    
+    return {
+        'accession': fields['accession'] or fields['accession_version'],
+        'definition': fields['definition'],
+        'sequence': fields['sequence'],
+    }
+
+
+def _format_blast_record(record: FASTARecord) -> str:
+    """Format one record for create_blast_database_fasta, newline-terminated."""
+    # BLAST prefers specific header format
+    header = f">{record.accession}"
+    if record.gi:
+        header = f">gi|{record.gi}|ref|{record.accession}|"
+    if record.description:
+        header += f" {record.description}"
+    
+    # Add sequence in 80-character lines (BLAST standard)
+    sequence = record.sequence
+    wrapped = _WRAP80.sub(r'\1\n', sequence)
+    if len(sequence) % 80:
+        wrapped += '\n'
+    return header + '\n' + wrapped
+
+
+def _format_fasta_chunk(records: List[FASTARecord]) -> str:
+    """Join records into one split_multifasta chunk."""
+    buffer = io.StringIO()
+    buffer.writelines(record.to_fasta() + '\n' for record in records)
+    return _joined_value(buffer)
 
 
 class FormatConverter:
@@ -17,21 +217,92 @@ class FormatConverter:
     """
     
     @staticmethod
-    def xml_to_fasta(xml_content: str) -> str:
+    def _iter_genbank_xml(xml_content: Union[str, bytes, mmap.mmap],
+                          fields: Sequence[str] = tuple(_GBSEQ_FIELDS)) -> Iterator[Dict[str, Any]]:
+        """
+        Stream GBSeq records out of GenBank XML one at a time.
+        
+        Each GBSeq element is discarded once its fields are read, so memory
+        stays bounded by the largest single record. Only the requested fields
+        are extracted.
+        
+        Args:
+            xml_content: GenBank XML content, as text or as bytes/mmap
+            fields: Fields to extract, any of accession, definition, organism,
+                length and sequence
+            
+        Yields:
+            Dictionaries holding the requested fields
+        """
+        projection = [(name, _GBSEQ_FIELDS[name]) for name in fields]
+        
+        if isinstance(xml_content, str):
+            if xml_content.startswith('\ufeff'):
+                xml_content = xml_content[1:]
+            if etree is not None:
+                source = io.BytesIO(xml_content.encode('utf-8'))
+            else:
+                source = io.StringIO(xml_content)
+        elif hasattr(xml_content, 'read'):
+            # mmap regions are read in place by the parser
+            source = xml_content
+        else:
+            source = io.BytesIO(xml_content)
+        
+        if etree is not None:
+            # huge_tree lifts libxml2's 10 MB text node limit for long sequences
+            context = etree.iterparse(source, events=('end',), tag='GBSeq', huge_tree=True)
+        else:
+            context = ET.iterparse(source, events=('end',))
+        
+        for event, elem in context:
+            if elem.tag != 'GBSeq':
+                continue
+            
+            record = {}
+            for name, tag in projection:
+                if name == 'length':
+                    record[name] = int(elem.findtext(tag, '0'))
+                else:
+                    record[name] = elem.findtext(tag)
+            if 'accession' in record and not record['accession']:
+                record['accession'] = elem.findtext('GBSeq_accession-version')
+            
+            yield record
+            
+            elem.clear()
+            if etree is not None:
+                # Drop already-processed siblings so the root does not grow
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+    
+    @staticmethod
+    def xml_to_fasta(xml_content: Union[str, bytes, mmap.mmap]) -> str:
         """
         Convert XML sequence data to FASTA format.
         
         Args:
-            xml_content: XML content containing sequence data
+            xml_content: XML content containing sequence data, as text or
+                as bytes/mmap
             
         Returns:
             FASTA formatted string
         """
         try:
-            # Parse GenBank XML format
-            records = XMLParser.parse_genbank_set(xml_content)
+            records = None
+            if isinstance(xml_content, str):
+                # Single-record responses (one fetched accession) skip the parser
+                single = _single_gbseq_record(xml_content)
+                if single is not None:
+                    records = (single,)
+            
+            if records is None:
+                # Stream records from the GenBank XML
+                records = FormatConverter._iter_genbank_xml(
+                    xml_content, fields=('accession', 'definition', 'sequence')
+                )
             
-            fasta_lines = []
+            buffer = io.StringIO()
             for record in records:
                 if record.get('accession') and record.get('sequence'):
                     header = f">{record['accession']}"
@@ -41,89 +312,81 @@ class FormatConverter:
                     sequence = record['sequence']
                     
                     # Add header
-                    fasta_lines.append(header)
+                    buffer.write(header + '\n')
                     
                     # Add sequence in 70-character lines
-                    for i in range(0, len(sequence), 70):
-                        fasta_lines.append(sequence[i:i+70])
+                    buffer.write(_WRAP70.sub(r'\1\n', sequence))
+                    if len(sequence) % 70:
+                        buffer.write('\n')
             
-            return '\n'.join(fasta_lines)
+            return _joined_value(buffer)
             
         except Exception as e:
             raise ParseError(f"Failed to convert XML to FASTA: {str(e)}")
     
     @staticmethod
-    def genbank_to_fasta(genbank_content: str) -> str:
+    def genbank_to_fasta(genbank_content: Union[str, Sequence[GenBankRecord]]) -> str:
         """
         Convert GenBank format to FASTA.
         
         Args:
-            genbank_content: GenBank formatted content
+            genbank_content: GenBank formatted content or already parsed records
             
         Returns:
             FASTA formatted string
         """
         try:
-            records = GenBankParser.parse(genbank_content)
-            fasta_parts = []
+            if isinstance(genbank_content, str):
+                records = GenBankParser.parse(genbank_content)
+            else:
+                records = genbank_content
+            buffer = io.StringIO()
             
-            for record in records:
-                fasta_parts.append(GenBankParser.to_fasta(record))
+            buffer.writelines(GenBankParser.to_fasta(record) + '\n' for record in records)
             
-            return '\n'.join(fasta_parts)
+            return _joined_value(buffer)
             
         except Exception as e:
             raise ParseError(f"Failed to convert GenBank to FASTA: {str(e)}")
     
     @staticmethod
-    def fasta_to_genbank_minimal(fasta_content: str, source_organism: str = "Unknown") -> str:
+    def fasta_to_genbank_minimal(fasta_content: Union[str, Sequence[FASTARecord]],
+                                 source_organism: str = "Unknown") -> str:
         """
         Convert FASTA to minimal GenBank format.
         
         Args:
-            fasta_content: FASTA formatted content
+            fasta_content: FASTA formatted content or already parsed records
             source_organism: Source organism name
             
         Returns:
             GenBank formatted string
         """
         try:
-            records = FASTAParser.parse(fasta_content)
-            genbank_parts = []
+            if isinstance(fasta_content, str):
+                records = FASTAParser.parse(fasta_content)
+            else:
+                records = fasta_content
+            buffer = io.StringIO()
             
             for i, record in enumerate(records):
                 # Create minimal GenBank record
                 accession = record.accession or f"UNKNOWN_{i+1}"
                 length = record.length
                 
-                genbank_text = f"""LOCUS       {accession:<16} {length:>8} bp    DNA     linear   UNK 01-JAN-1980
-DEFINITION  {record.description or "No description available"}
-ACCESSION   {accession}
-VERSION     {accession}.1
-KEYWORDS    .
-SOURCE      {source_organism}
-  ORGANISM  {source_organism}
-            Unclassified.
-FEATURES             Location/Qualifiers
-     source          1..{length}
-                     /organism="{source_organism}"
-ORIGIN      
-"""
+                buffer.write(_GB_HEADER_TMPL.format_map({
+                    'accession': accession,
+                    'length': length,
+                    'definition': record.description or "No description available",
+                    'organism': source_organism,
+                }))
                 
                 # Add sequence with numbering
-                sequence = record.sequence.lower()
-                for i in range(0, len(sequence), 60):
-                    line_start = i + 1
-                    line_seq = sequence[i:i+60]
-                    
-                    # Format sequence in groups of 10
-                    formatted_seq = ' '.join([line_seq[j:j+10] for j in range(0, len(line_seq), 10)])
-                    genbank_text += f"{line_start:>9} {formatted_seq}\n"
+                _write_origin(buffer, record.sequence.lower())
                 
-                genbank_text += "//\n"
-                genbank_parts.append(genbank_text)
+                buffer.write("//\n\n")
             
-            return '\n'.join(genbank_parts)
+            return _joined_value(buffer)
             
         except Exception as e:
             raise ParseError(f"Failed to convert FASTA to GenBank: {str(e)}")
@@ -139,34 +402,26 @@ ORIGIN
         Returns:
             Detected format ('fasta', 'genbank', 'xml', 'unknown')
         """
-        content = content.strip()
+        # Only the first 1000 characters after leading whitespace are inspected
+        start = _LEADING_WS.match(content).end()
+        match = _FORMAT_RE.match(content, start, start + 1000)
         
-        # Check for FASTA
-        if content.startswith('>'):
+        if not match:
+            return 'unknown'
+        if match.group('fasta'):
             return 'fasta'
-        
-        # Check for XML
-        if content.startswith('<?xml') or content.startswith('<'):
+        if match.group('xml'):
             return 'xml'
-        
-        # Check for GenBank
-        if content.startswith('LOCUS'):
-            return 'genbank'
-        
-        # Check for common GenBank keywords
-        genbank_keywords = ['DEFINITION', 'ACCESSION', 'VERSION', 'SOURCE', 'FEATURES', 'ORIGIN']
-        if any(keyword in content[:1000] for keyword in genbank_keywords):
-            return 'genbank'
-        
-        return 'unknown'
+        return 'genbank'
     
     @staticmethod
-    def convert_format(content: str, from_format: str, to_format: str, **kwargs) -> str:
+    def convert_format(content: Union[str, os.PathLike], from_format: str, to_format: str,
+                       **kwargs) -> str:
         """
         Convert between formats.
         
         Args:
-            content: Input content
+            content: Input content, or a path (os.PathLike) to a file holding it
             from_format: Source format
             to_format: Target format
             **kwargs: Additional conversion parameters
@@ -174,6 +429,9 @@ ORIGIN
         Returns:
             Converted content
         """
+        if isinstance(content, os.PathLike):
+            return FormatConverter._convert_file(content, from_format, to_format, **kwargs)
+        
         # Auto-detect source format if not specified
         if from_format == 'auto':
             from_format = FormatConverter.detect_format(content)
@@ -195,6 +453,43 @@ ORIGIN
         else:
             raise ParseError(f"Conversion from {from_format} to {to_format} not supported")
     
+    @staticmethod
+    def _convert_file(path: os.PathLike, from_format: str, to_format: str, **kwargs) -> str:
+        """
+        Convert a file by memory-mapping it rather than reading it into a string.
+        
+        Format detection only touches the start of the mapping and XML is
+        parsed straight from it; other formats are decoded from the mapping
+        once.
+        
+        Args:
+            path: Path to the input file
+            from_format: Source format
+            to_format: Target format
+            **kwargs: Additional conversion parameters
+            
+        Returns:
+            Converted content
+        """
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap cannot map an empty file
+                return FormatConverter.convert_format('', from_format, to_format, **kwargs)
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if from_format == 'auto':
+                    # 4000 bytes cover the 1000 characters detect_format inspects
+                    start = _LEADING_WS_BYTES.match(mapped).end()
+                    prefix = mapped[start:start + 4000].decode('utf-8', 'ignore')
+                    from_format = FormatConverter.detect_format(prefix)
+                
+                if from_format == 'xml' and to_format == 'fasta':
+                    return FormatConverter.xml_to_fasta(mapped)
+                
+                content = str(mapped, 'utf-8')
+        
+        return FormatConverter.convert_format(content, from_format, to_format, **kwargs)
+    
     @staticmethod
     def extract_sequences_from_xml(xml_content: str) -> List[Dict[str, str]]:
         """
@@ -207,76 +502,97 @@ ORIGIN
             List of sequence dictionaries
         """
         try:
-            records = XMLParser.parse_genbank_set(xml_content)
-            sequences = []
-            
-            for record in records:
-                seq_info = {
-                    'accession': record.get('accession', ''),
-                    'definition': record.get('definition', ''),
-                    'organism': record.get('organism', ''),
-                    'length': record.get('length', 0),
-                    'sequence': record.get('sequence', '')
-                }
-                sequences.append(seq_info)
-            
-            return sequences
+            # The XML layer already yields the final per-record dictionaries
+            return list(FormatConverter._iter_genbank_xml(xml_content))
             
         except Exception as e:
             raise ParseError(f"Failed to extract sequences from XML: {str(e)}")
     
     @staticmethod
-    def create_blast_database_fasta(records: List[FASTARecord]) -> str:
+    def create_blast_database_fasta(records: List[FASTARecord], workers: int = 1) -> str:
         """
         Format FASTA records for BLAST database creation.
         
         Args:
             records: List of FASTA records
+            workers: Worker processes used to format large record lists
             
         Returns:
             BLAST-formatted FASTA string
         """
-        blast_lines = []
-        
-        for record in records:
-            # BLAST prefers specific header format
-            header = f">{record.accession}"
-            if record.gi:
-                header = f">gi|{record.gi}|ref|{record.accession}|"
-            if record.description:
-                header += f" {record.description}"
+        buffer = io.StringIO()
+        
+        if workers > 1 and len(records) >= _PARALLEL_MIN_RECORDS:
+            chunksize = max(1, len(records) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                buffer.writelines(executor.map(_format_blast_record, records, chunksize=chunksize))
+        else:
+            buffer.writelines(_format_blast_record(record) for record in records)
+        
+        return _joined_value(buffer)
+    
+    @staticmethod
+    def iter_split_multifasta(fasta_content: str,
+                              max_records_per_file: int = 1000) -> Iterator[str]:
+        """
+        Split large FASTA content into chunks, yielding one chunk at a time.
+        
+        Records are streamed from the input, so only the chunk being built is
+        held in memory alongside the content itself.
+        
+        Args:
+            fasta_content: FASTA content to split
+            max_records_per_file: Maximum records per chunk
             
-            blast_lines.append(header)
+        Yields:
+            FASTA chunks
             
-            # Add sequence in 80-character lines (BLAST standard)
-            sequence = record.sequence
-            for i in range(0, len(sequence), 80):
-                blast_lines.append(sequence[i:i+80])
+        Raises:
+            ValidationError: If max_records_per_file is less than 1
+        """
+        if max_records_per_file < 1:
+            raise ValidationError("max_records_per_file must be at least 1")
         
-        return '\n'.join(blast_lines)
+        chunk = []
+        
+        for record in FASTAParser.parse_iterator(fasta_content):
+            chunk.append(record)
+            
+            if len(chunk) == max_records_per_file:
+                yield _format_fasta_chunk(chunk)
+                chunk = []
+        
+        if chunk:
+            yield _format_fasta_chunk(chunk)
     
     @staticmethod
-    def split_multifasta(fasta_content: str, max_records_per_file: int = 1000) -> List[str]:
+    def split_multifasta(fasta_content: str, max_records_per_file: int = 1000,
+                         workers: int = 1) -> List[str]:
         """
         Split large FASTA file into smaller chunks.
         
+        Prefer iter_split_multifasta when chunks can be handled one at a time.
+        
         Args:
             fasta_content: FASTA content to split
             max_records_per_file: Maximum records per chunk
+            workers: Worker processes used to format chunks of large inputs
             
         Returns:
             List of FASTA chunks
         """
-        records = FASTAParser.parse(fasta_content)
-        chunks = []
-        
-        for i in range(0, len(records), max_records_per_file):
-            chunk_records = records[i:i + max_records_per_file]
-            chunk_lines = []
+        if workers > 1:
+            if max_records_per_file < 1:
+                raise ValidationError("max_records_per_file must be at least 1")
             
-            for record in chunk_records:
-                chunk_lines.append(record.to_fasta())
+            records = FASTAParser.parse(fasta_content)
+            batches = [records[i:i + max_records_per_file]
+                       for i in range(0, len(records), max_records_per_file)]
+            if len(records) >= _PARALLEL_MIN_RECORDS:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(_format_fasta_chunk, batches))
             
-            chunks.append('\n'.join(chunk_lines))
+            # Too few records to pay for a pool; format the parsed ones here
+            return [_format_fasta_chunk(batch) for batch in batches]
         
-        return chunks
+        return list(FormatConverter.iter_split_multifasta(fasta_content, max_records_per_file))
@@ -5,10 +5,388 @@ Provides utilities for working with biological sequences.
 """
 
 import re
-from typing import Dict, List, Tuple, Optional, Set
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import product
+from typing import Dict, List, Tuple, Optional, Set, Union
 from collections import Counter
+from ncbi_client.core.exceptions import ValidationError
 from ncbi_client.parsers.fasta_parser import FASTARecord
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional (installed with the 'data' extra)
+    np = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional (installed with the 'bio' extra)
+    ahocorasick = None
+
+# Codons translated per NumPy block; translation stops at the first stop codon,
+# so blocks keep early stops from paying for the whole sequence
+_TRANSLATE_BLOCK_CODONS = 1024
+# Shorter inputs translate faster with the plain codon loop
+_TRANSLATE_NUMPY_MIN_LENGTH = 150
+# Below this length GC content is cheaper to count with str.count
+_GC_NUMPY_MIN_LENGTH = 4096
+# Shorter strands are scanned for ORFs faster with the codon regexes
+_ORF_NUMPY_MIN_LENGTH = 1024
+# Shorter sequences are searched for repeats faster without the k-mer code filter
+_REPEAT_NUMPY_MIN_LENGTH = 2048
+_NUCLEOTIDES = 'TCAG'
+
+_START_CODON_RE = re.compile('ATG')
+_STOP_CODON_RE = re.compile('TAA|TAG|TGA')
+
+# Ambiguity codes find_restriction_sites understands in recognition sites
+_SITE_EXPANSIONS = {'N': 'ATGC', 'R': 'AG', 'Y': 'CT'}
+# Sites expanding to more literals than this are matched with a regex instead
+_MAX_SITE_LITERALS = 256
+
+if np is not None:
+    # Byte -> base index (T, C, A, G = 0..3); anything else maps to 4
+    _BASE_INDEX = np.full(256, 4, dtype=np.uint8)
+    for _index, _base in enumerate(_NUCLEOTIDES):
+        _BASE_INDEX[ord(_base)] = _index
+
+
+def _expand_site(site: str) -> Optional[List[str]]:
+    """
+    Expand a recognition site into the literal sequences it matches.
+    
+    Args:
+        site: Upper-case recognition site
+        
+    Returns:
+        List of literals, or None if the site has to be matched as a regex
+    """
+    if not (site.isascii() and site.isalpha()):
+        return None
+    
+    choices = [_SITE_EXPANSIONS.get(base, base) for base in site]
+    literal_count = 1
+    for bases in choices:
+        literal_count *= len(bases)
+    if literal_count > _MAX_SITE_LITERALS:
+        return None
+    
+    return [''.join(literal) for literal in product(*choices)]
+
+
+def _orf_spans(strand: str, min_length: int) -> List[Tuple[int, int]]:
+    """
+    Locate ORFs on one strand, reading from every ATG to its next in-frame stop.
+    
+    Args:
+        strand: Upper-case DNA strand
+        min_length: Minimum ORF length in nucleotides
+        
+    Returns:
+        (start, stop codon position) pairs, ordered by start
+    """
+    if np is not None and len(strand) >= _ORF_NUMPY_MIN_LENGTH and strand.isascii():
+        bases = np.frombuffer(strand.encode('ascii'), dtype=np.uint8)
+        first, second, third = bases[:-2], bases[1:-1], bases[2:]
+        starts = np.flatnonzero((first == ord('A')) & (second == ord('T')) & (third == ord('G')))
+        stops = np.flatnonzero(
+            (first == ord('T'))
+            & (((second == ord('A')) & ((third == ord('A')) | (third == ord('G'))))
+               | ((second == ord('G')) & (third == ord('A'))))
+        )
+        
+        # Next in-frame stop codon is the first one of the same phase after the start
+        span_starts = []
+        span_stops = []
+        for phase in range(3):
+            phase_starts = starts[starts % 3 == phase]
+            phase_stops = stops[stops % 3 == phase]
+            index = np.searchsorted(phase_stops, phase_starts)
+            closed = index < len(phase_stops)
+            span_starts.append(phase_starts[closed])
+            span_stops.append(phase_stops[index[closed]])
+        
+        span_starts = np.concatenate(span_starts)
+        span_stops = np.concatenate(span_stops)
+        keep = span_stops - span_starts + 3 >= min_length
+        order = np.argsort(span_starts[keep], kind='stable')
+        return list(zip(span_starts[keep][order].tolist(), span_stops[keep][order].tolist()))
+    
+    # Stop codon positions grouped by phase (position mod 3), in order.
+    # Stop codons cannot overlap, so one scan finds them all.
+    stops_by_phase = ([], [], [])
+    for stop_match in _STOP_CODON_RE.finditer(strand):
+        stop_pos = stop_match.start()
+        stops_by_phase[stop_pos % 3].append(stop_pos)
+    
+    spans = []
+    for start_match in _START_CODON_RE.finditer(strand):
+        start_pos = start_match.start()
+        
+        # Next in-frame stop codon is the first one of the same phase after the start
+        in_frame_stops = stops_by_phase[start_pos % 3]
+        index = bisect_left(in_frame_stops, start_pos)
+        if index == len(in_frame_stops):
+            continue
+        stop_pos = in_frame_stops[index]
+        
+        if stop_pos - start_pos + 3 >= min_length:
+            spans.append((start_pos, stop_pos))
+    
+    return spans
+
+
+def _codon_lut(codon_table: Dict[str, str]) -> 'np.ndarray':
+    """
+    Build the 125-entry codon lookup used by vectorized translation.
+    
+    Args:
+        codon_table: Codon to amino acid mapping
+        
+    Returns:
+        Amino acid bytes indexed by base index (T, C, A, G, other) of each
+        codon position, in base 5; codons with other bases map to 'X'
+    """
+    lut = np.full(125, ord('X'), dtype=np.uint8)
+    for codon, amino_acid in codon_table.items():
+        if all(base in _NUCLEOTIDES for base in codon):
+            index = (_NUCLEOTIDES.index(codon[0]) * 25 + _NUCLEOTIDES.index(codon[1]) * 5
+                     + _NUCLEOTIDES.index(codon[2]))
+            lut[index] = ord(amino_acid)
+    return lut
+
+
+def _primer_stats(length: int, gc_count: int, at_count: int) -> Tuple[float, float]:
+    """
+    Melting temperature and GC content of a primer from its base counts.
+    
+    Matches calculate_melting_temperature and calculate_gc_content.
+    
+    Args:
+        length: Primer length
+        gc_count: Number of G and C bases
+        at_count: Number of A and T bases
+        
+    Returns:
+        Tuple of melting temperature and GC percentage
+    """
+    gc_content = (gc_count / length) * 100 if length else 0.0
+    
+    if length < 14:
+        # Wallace rule for short sequences
+        return 2 * at_count + 4 * gc_count, gc_content
+    return 64.9 + 41 * (gc_content - 16.4) / length, gc_content
+
+
+def _primer_candidates(sequence: str, min_len: int, max_len: int,
+                       min_tm: float, max_tm: float) -> List[Dict[str, any]]:
+    """
+    Collect primer candidates near both ends of a sequence.
+    
+    Args:
+        sequence: Upper-case target DNA sequence
+        min_len: Minimum primer length
+        max_len: Maximum primer length
+        min_tm: Minimum melting temperature
+        max_tm: Maximum melting temperature
+        
+    Returns:
+        Forward candidates by start, then reverse candidates by descending end
+    """
+    primers = []
+    # Bound once; these run for every window or accepted primer
+    primer_stats = _primer_stats
+    reverse_complement = SequenceTools.reverse_complement
+    
+    # Design forward primers
+    for start in range(min(100, len(sequence) - min_len)):
+        # Base counts grow with the primer instead of being recounted per length
+        window = sequence[start:start + min_len]
+        gc_count = window.count('G') + window.count('C')
+        at_count = window.count('A') + window.count('T')
+        
+        for length in range(min_len, min(max_len + 1, len(sequence) - start + 1)):
+            if length > min_len:
+                base = sequence[start + length - 1]
+                if base in 'GC':
+                    gc_count += 1
+                elif base in 'AT':
+                    at_count += 1
+            
+            tm, gc = primer_stats(length, gc_count, at_count)
+            
+            if min_tm <= tm <= max_tm and 40 <= gc <= 60:
+                primers.append({
+                    'sequence': sequence[start:start + length],
+                    'start': start,
+                    'end': start + length,
+                    'length': length,
+                    'tm': tm,
+                    'gc_content': gc,
+                    'type': 'forward'
+                })
+    
+    # Design reverse primers (from 3' end). Complementing keeps the A/T and
+    # G/C counts, so the window is only reverse-complemented when accepted.
+    for end in range(len(sequence) - min_len, max(len(sequence) - 100, min_len - 1), -1):
+        window = sequence[end - min_len:end]
+        gc_count = window.count('G') + window.count('C')
+        at_count = window.count('A') + window.count('T')
+        
+        for length in range(min_len, min(max_len + 1, end + 1)):
+            if length > min_len:
+                base = sequence[end - length]
+                if base in 'GC':
+                    gc_count += 1
+                elif base in 'AT':
+                    at_count += 1
+            
+            tm, gc = primer_stats(length, gc_count, at_count)
+            
+            if min_tm <= tm <= max_tm and 40 <= gc <= 60:
+                primers.append({
+                    'sequence': reverse_complement(sequence[end - length:end]),
+                    'start': end - length,
+                    'end': end,
+                    'length': length,
+                    'tm': tm,
+                    'gc_content': gc,
+                    'type': 'reverse'
+                })
+    
+    return primers
+
+
+def _primer_candidates_numpy(sequence: str, min_len: int, max_len: int,
+                             min_tm: float, max_tm: float) -> List[Dict[str, any]]:
+    """
+    Vectorized _primer_candidates for ASCII sequences.
+    
+    Every (position, length) window is scored at once from cumulative GC/AT
+    counts, using the same arithmetic as _primer_stats.
+    
+    Args:
+        sequence: Upper-case ASCII target DNA sequence
+        min_len: Minimum primer length
+        max_len: Maximum primer length
+        min_tm: Minimum melting temperature
+        max_tm: Maximum melting temperature
+        
+    Returns:
+        Same candidates, in the same order, as _primer_candidates
+    """
+    seq_len = len(sequence)
+    lengths = np.arange(min_len, max_len + 1)
+    
+    def accepted(window_starts, window_lengths):
+        if not len(window_starts):
+            return [], [], [], []
+        
+        # Count bases only in the part of the sequence the windows cover
+        region_start = int(window_starts.min())
+        region_end = int((window_starts + window_lengths).max())
+        bases = np.frombuffer(sequence[region_start:region_end].encode('ascii'), dtype=np.uint8)
+        cum_gc = np.concatenate(([0], np.cumsum((bases == ord('G')) | (bases == ord('C')))))
+        cum_at = np.concatenate(([0], np.cumsum((bases == ord('A')) | (bases == ord('T')))))
+        
+        offsets = window_starts - region_start
+        gc_count = cum_gc[offsets + window_lengths] - cum_gc[offsets]
+        at_count = cum_at[offsets + window_lengths] - cum_at[offsets]
+        gc = (gc_count / window_lengths) * 100
+        tm = np.where(window_lengths < 14, 2 * at_count + 4 * gc_count,
+                      64.9 + 41 * (gc - 16.4) / window_lengths)
+        
+        keep = (min_tm <= tm) & (tm <= max_tm) & (40 <= gc) & (gc <= 60)
+        return (window_starts[keep].tolist(), window_lengths[keep].tolist(),
+                tm[keep].tolist(), gc[keep].tolist())
+    
+    primers = []
+    reverse_complement = SequenceTools.reverse_complement
+    
+    # Design forward primers: windows ordered by start, then length
+    starts = np.arange(min(100, seq_len - min_len))
+    if len(starts) and len(lengths):
+        grid_starts, grid_lengths = np.meshgrid(starts, lengths, indexing='ij')
+        fits = grid_lengths <= seq_len - grid_starts
+        for start, length, tm, gc in zip(*accepted(grid_starts[fits], grid_lengths[fits])):
+            primers.append({
+                'sequence': sequence[start:start + length],
+                'start': start,
+                'end': start + length,
+                'length': length,
+                'tm': int(tm) if length < 14 else tm,
+                'gc_content': gc,
+                'type': 'forward'
+            })
+    
+    # Design reverse primers (from 3' end): windows ordered by descending end, then length
+    ends = np.arange(seq_len - min_len, max(seq_len - 100, min_len - 1), -1)
+    if len(ends) and len(lengths):
+        grid_ends, grid_lengths = np.meshgrid(ends, lengths, indexing='ij')
+        fits = grid_lengths <= grid_ends
+        window_starts = grid_ends[fits] - grid_lengths[fits]
+        for start, length, tm, gc in zip(*accepted(window_starts, grid_lengths[fits])):
+            primers.append({
+                'sequence': reverse_complement(sequence[start:start + length]),
+                'start': start,
+                'end': start + length,
+                'length': length,
+                'tm': int(tm) if length < 14 else tm,
+                'gc_content': gc,
+                'type': 'reverse'
+            })
+    
+    return primers
+
+
+@lru_cache(maxsize=256)
+def _site_pattern(site: str) -> 're.Pattern':
+    """
+    Compile the regex for an upper-case recognition site.
+    
+    Args:
+        site: Upper-case recognition site
+        
+    Returns:
+        Compiled pattern with ambiguous bases expanded to character classes
+    """
+    # Handle ambiguous bases in recognition sites
+    return re.compile(site.replace('N', '[ATGC]').replace('R', '[AG]').replace('Y', '[CT]'))
+
+
+@lru_cache(maxsize=8)
+def _restriction_automaton(sites: Tuple[Tuple[str, str], ...]):
+    """
+    Build one Aho-Corasick automaton over all expandable recognition sites.
+    
+    Args:
+        sites: (enzyme, upper-case site) pairs
+        
+    Returns:
+        Tuple of the automaton (None if no site could be expanded) and the
+        (enzyme, site) pairs left for regex matching
+    """
+    enzymes_by_literal: Dict[str, List[str]] = {}
+    regex_sites = []
+    
+    for enzyme, site in sites:
+        literals = _expand_site(site)
+        if literals is None:
+            regex_sites.append((enzyme, site))
+            continue
+        for literal in literals:
+            enzymes_by_literal.setdefault(literal, []).append(enzyme)
+    
+    if not enzymes_by_literal:
+        return None, regex_sites
+    
+    automaton = ahocorasick.Automaton()
+    for literal, enzymes in enzymes_by_literal.items():
+        automaton.add_word(literal, (len(literal), tuple(enzymes)))
+    automaton.make_automaton()
+    
+    return automaton, regex_sites
+
 
 class SequenceTools:
     """
@@ -37,26 +415,38 @@ class SequenceTools:
         }
     }
     
+    # Per genetic code: 125-entry lookup (5 symbols per codon position) of amino acids
+    _CODON_LUTS: Dict[int, 'np.ndarray'] = {}
+    
+    # Complement lookup for str.translate; unlisted characters pass through
+    _COMPLEMENT_TABLE = str.maketrans(
+        'ATGCatgcNnRYSWKMBVDHryswkmbvdh',
+        'TACGtacgNnYRSWMKVBHDyrswmkvbhd'
+    )
+    _COMPLEMENT_BYTES = bytes.maketrans(
+        b'ATGCatgcNnRYSWKMBVDHryswkmbvdh',
+        b'TACGtacgNnYRSWMKVBHDyrswmkvbhd'
+    )
+    
     @staticmethod
-    def reverse_complement(sequence: str) -> str:
+    def reverse_complement(sequence: Union[str, bytes, bytearray]) -> Union[str, bytes, bytearray]:
         """
         Get reverse complement of DNA sequence.
         
         Args:
-            sequence: DNA sequence
+            sequence: DNA sequence, as text or ASCII bytes
             
         Returns:
-            Reverse complement sequence
+            Reverse complement sequence, of the same type as the input
         """
-        complement_map = {
-            'A': 'T', 'T': 'A', 'G': 'C', 'C': 'G',
-            'a': 't', 't': 'a', 'g': 'c', 'c': 'g',
-            'N': 'N', 'n': 'n', 'R': 'Y', 'Y': 'R',
-            'S': 'S', 'W': 'W', 'K': 'M', 'M': 'K',
-            'B': 'V', 'V': 'B', 'D': 'H', 'H': 'D'
-        }
+        if isinstance(sequence, (bytes, bytearray)):
+            return sequence.translate(SequenceTools._COMPLEMENT_BYTES)[::-1]
+        
+        if sequence.isascii():
+            # A flat 256-byte table translates faster than str.translate's mapping
+            return sequence.encode('ascii').translate(SequenceTools._COMPLEMENT_BYTES)[::-1].decode('ascii')
         
-        return ''.join(complement_map.get(base, base) for base in reversed(sequence))
+        return sequence.translate(SequenceTools._COMPLEMENT_TABLE)[::-1]
     
     @staticmethod
     def translate(sequence: str, genetic_code: int = 1, start_codon: bool = True) -> str:
@@ -71,25 +461,87 @@ class SequenceTools:
         Returns:
             Translated protein sequence
         """
-        codon_table = SequenceTools.GENETIC_CODES.get(genetic_code, SequenceTools.GENETIC_CODES[1])
         sequence = sequence.upper().replace('U', 'T')  # Handle RNA
         
         # Find start codon if requested
         start_pos = 0
         if start_codon:
-            start_match = re.search(r'ATG', sequence)
+            start_match = _START_CODON_RE.search(sequence)
             if start_match:
                 start_pos = start_match.start()
         
-        # Translate from start position
+        return SequenceTools._translate_normalized(sequence, start_pos, genetic_code)
+    
+    @staticmethod
+    def _translate_normalized(sequence: str, start_pos: int, genetic_code: int) -> str:
+        """
+        Translate an already upper-cased DNA sequence from a given position.
+        
+        Args:
+            sequence: Upper-case DNA sequence with U replaced by T
+            start_pos: Position of the first codon
+            genetic_code: Genetic code table number
+            
+        Returns:
+            Protein sequence up to and including the first stop codon
+        """
+        codon_table = SequenceTools.GENETIC_CODES.get(genetic_code, SequenceTools.GENETIC_CODES[1])
+        
+        if (np is not None and len(sequence) - start_pos >= _TRANSLATE_NUMPY_MIN_LENGTH
+                and sequence.isascii()):
+            return SequenceTools._translate_numpy(sequence, start_pos, genetic_code, codon_table)
+        
+        # Translate from start position, a block of codons at a time
+        lookup = codon_table.get
+        block_length = _TRANSLATE_BLOCK_CODONS * 3
         protein = []
-        for i in range(start_pos, len(sequence) - 2, 3):
-            codon = sequence[i:i+3]
-            if len(codon) == 3:
-                amino_acid = codon_table.get(codon, 'X')
-                protein.append(amino_acid)
-                if amino_acid == '*':  # Stop codon
-                    break
+        for block in range(start_pos, len(sequence) - 2, block_length):
+            block_end = min(block + block_length, len(sequence) - 2)
+            amino_acids = ''.join([lookup(sequence[i:i + 3], 'X') for i in range(block, block_end, 3)])
+            
+            stop = amino_acids.find('*')  # Stop codon
+            if stop != -1:
+                protein.append(amino_acids[:stop + 1])
+                break
+            protein.append(amino_acids)
+        
+        return ''.join(protein)
+    
+    @staticmethod
+    def _translate_numpy(sequence: str, start_pos: int, genetic_code: int,
+                         codon_table: Dict[str, str]) -> str:
+        """
+        Translate an upper-case ASCII sequence with a vectorized codon lookup.
+        
+        Args:
+            sequence: Upper-case DNA sequence
+            start_pos: Position of the first codon
+            genetic_code: Genetic code table number (cache key)
+            codon_table: Codon to amino acid mapping
+            
+        Returns:
+            Protein sequence up to and including the first stop codon
+        """
+        lut = SequenceTools._CODON_LUTS.get(genetic_code)
+        if lut is None:
+            # Codes added to GENETIC_CODES after import
+            lut = SequenceTools._CODON_LUTS[genetic_code] = _codon_lut(codon_table)
+        
+        n_codons = (len(sequence) - start_pos) // 3
+        codons = np.frombuffer(sequence.encode('ascii'), dtype=np.uint8,
+                               count=n_codons * 3, offset=start_pos).reshape(n_codons, 3)
+        
+        protein = []
+        for block in range(0, n_codons, _TRANSLATE_BLOCK_CODONS):
+            chunk = _BASE_INDEX[codons[block:block + _TRANSLATE_BLOCK_CODONS]].astype(np.uint16)
+            indices = chunk[:, 0] * 25 + chunk[:, 1] * 5 + chunk[:, 2]
+            amino_acids = lut[indices].tobytes().decode('ascii')
+            
+            stop = amino_acids.find('*')
+            if stop != -1:
+                protein.append(amino_acids[:stop + 1])
+                break
+            protein.append(amino_acids)
         
         return ''.join(protein)
     
@@ -108,64 +560,55 @@ class SequenceTools:
         sequence = sequence.upper().replace('U', 'T')
         orfs = []
         
-        # Check all 6 reading frames (3 forward, 3 reverse)
-        sequences = [
-            sequence,  # Frame 1
-            sequence[1:],  # Frame 2
-            sequence[2:],  # Frame 3
-            SequenceTools.reverse_complement(sequence),  # Frame -1
-            SequenceTools.reverse_complement(sequence)[1:],  # Frame -2
-            SequenceTools.reverse_complement(sequence)[2:]   # Frame -3
-        ]
-        
-        for frame_idx, seq in enumerate(sequences):
-            frame = frame_idx + 1 if frame_idx < 3 else -(frame_idx - 2)
-            
-            # Find start codons
-            for start_match in re.finditer(r'ATG', seq):
-                start_pos = start_match.start()
+        # Check all 6 reading frames (3 forward, 3 reverse). Frames 2 and 3 of a
+        # strand are its suffixes from offsets 1 and 2, so they report the same
+        # ORFs as frame 1 minus those starting before the offset; each strand is
+        # scanned and translated once and the hits are replayed per frame.
+        strands = (
+            (sequence, (1, 2, 3)),
+            (SequenceTools.reverse_complement(sequence), (-1, -2, -3))
+        )
+        
+        translate = SequenceTools._translate_normalized
+        
+        for strand, frames in strands:
+            hits = []
+            for start, stop in _orf_spans(strand, min_length):
+                orf_seq = strand[start:stop + 3]
                 
-                # Find next stop codon
-                for stop_match in re.finditer(r'(TAA|TAG|TGA)', seq[start_pos:]):
-                    stop_pos = start_pos + stop_match.start()
-                    
-                    # Check if in frame
-                    if (stop_pos - start_pos) % 3 == 0:
-                        length = stop_pos - start_pos + 3
-                        
-                        if length >= min_length:
-                            orf_seq = seq[start_pos:stop_pos + 3]
-                            protein = SequenceTools.translate(orf_seq)
-                            
-                            # Calculate actual positions in original sequence
-                            if frame > 0:
-                                actual_start = start_pos + (frame - 1)
-                                actual_stop = stop_pos + (frame - 1) + 3
-                            else:
-                                actual_start = len(sequence) - (stop_pos + abs(frame) - 1) - 3
-                                actual_stop = len(sequence) - (start_pos + abs(frame) - 1)
-                            
-                            orfs.append({
-                                'frame': frame,
-                                'start': actual_start,
-                                'stop': actual_stop,
-                                'length': length,
-                                'dna_sequence': orf_seq,
-                                'protein_sequence': protein
-                            })
-                        break  # Only take first stop codon
+                # Calculate actual positions in original sequence
+                if frames[0] > 0:
+                    actual_start, actual_stop = start, stop + 3
+                else:
+                    actual_start, actual_stop = len(sequence) - stop - 3, len(sequence) - start
+                
+                hits.append((start, actual_start, actual_stop, orf_seq,
+                             translate(orf_seq, 0, 1)))
+            
+            for offset, frame in enumerate(frames):
+                for start, actual_start, actual_stop, orf_seq, protein in hits:
+                    if start < offset:
+                        continue
+                    orfs.append({
+                        'frame': frame,
+                        'start': actual_start,
+                        'stop': actual_stop,
+                        'length': len(orf_seq),
+                        'dna_sequence': orf_seq,
+                        'protein_sequence': protein
+                    })
         
         # Sort by length (longest first)
         orfs.sort(key=lambda x: x['length'], reverse=True)
         return orfs
     
     @staticmethod
-    def calculate_gc_content(sequence: str) -> float:
+    def calculate_gc_content(sequence: Union[str, bytes, bytearray]) -> float:
         """
         Calculate GC content of sequence.
         
         Args:
-            sequence: DNA/RNA sequence
+            sequence: DNA/RNA sequence, as text or ASCII bytes
             
         Returns:
             GC content as percentage
@@ -173,8 +616,20 @@ class SequenceTools:
         if not sequence:
             return 0.0
         
+        is_bytes = isinstance(sequence, (bytes, bytearray))
+        if (np is not None and len(sequence) >= _GC_NUMPY_MIN_LENGTH
+                and (is_bytes or sequence.isascii())):
+            # One pass over the bytes; OR-ing 0x20 folds G/C onto g/c
+            raw = sequence if is_bytes else sequence.encode('ascii')
+            folded = np.frombuffer(raw, dtype=np.uint8) | 0x20
+            gc_count = int(np.count_nonzero((folded == ord('g')) | (folded == ord('c'))))
+            return (gc_count / len(sequence)) * 100
+        
         sequence = sequence.upper()
-        gc_count = sequence.count('G') + sequence.count('C')
+        if is_bytes:
+            gc_count = sequence.count(b'G') + sequence.count(b'C')
+        else:
+            gc_count = sequence.count('G') + sequence.count('C')
         total_count = len(sequence)
         
         return (gc_count / total_count) * 100
@@ -215,22 +670,30 @@ class SequenceTools:
             Dictionary of enzyme names and cut positions
         """
         sequence = sequence.upper()
-        results = {}
+        sites = tuple((enzyme, site.upper()) for enzyme, site in enzyme_sites.items())
+        positions_by_enzyme = {enzyme: [] for enzyme, _ in sites}
         
-        for enzyme, site in enzyme_sites.items():
-            site = site.upper()
-            positions = []
-            
-            # Handle ambiguous bases in recognition sites
-            site_pattern = site.replace('N', '[ATGC]').replace('R', '[AG]').replace('Y', '[CT]')
-            
-            for match in re.finditer(site_pattern, sequence):
+        if ahocorasick is not None:
+            automaton, regex_sites = _restriction_automaton(sites)
+        else:
+            automaton, regex_sites = None, sites
+        
+        if automaton is not None:
+            # One pass reports every site occurrence, overlapping ones included;
+            # keep the leftmost non-overlapping hits per enzyme like re.finditer
+            for end_index, (length, enzymes) in automaton.iter(sequence):
+                start = end_index - length + 1
+                for enzyme in enzymes:
+                    positions = positions_by_enzyme[enzyme]
+                    if not positions or start >= positions[-1] + length:
+                        positions.append(start)
+        
+        for enzyme, site in regex_sites:
+            positions = positions_by_enzyme[enzyme]
+            for match in _site_pattern(site).finditer(sequence):
                 positions.append(match.start())
-            
-            if positions:
-                results[enzyme] = positions
         
-        return results
+        return {enzyme: positions for enzyme, positions in positions_by_enzyme.items() if positions}
     
     @staticmethod
     def find_repeats(sequence: str, min_length: int = 10, max_distance: int = 1000) -> List[Dict[str, any]]:
@@ -246,52 +709,102 @@ class SequenceTools:
             List of repeat dictionaries
         """
         sequence = sequence.upper()
-        repeats = []
-        
-        for i in range(len(sequence) - min_length):
-            for length in range(min_length, min(len(sequence) - i, 50)):
-                repeat_unit = sequence[i:i+length]
-                
-                # Look for next occurrence
-                search_start = i + length
-                search_end = min(i + max_distance, len(sequence))
+        seq_len = len(sequence)
+        found = []
+        
+        # Positions whose k-mer occurs more than once; a unit can only repeat
+        # at length k + 1 where its k-long prefix already did
+        candidates = range(seq_len - min_length + 1)
+        
+        kmer_codes = None
+        if (np is not None and seq_len >= _REPEAT_NUMPY_MIN_LENGTH and 0 < min_length < min(seq_len, 50)
+                and sequence.isascii()):
+            # 2-bit code per base (anything but ACGT shares a code) packed into one
+            # uint64 per k-mer; bases past the last 32 shift out. Equal k-mers get
+            # equal codes, so k-mers with a unique code can be dropped up front.
+            base_codes = (_BASE_INDEX[np.frombuffer(sequence.encode('ascii'), dtype=np.uint8)]
+                          & 3).astype(np.uint64)
+            kmer_codes = np.zeros(seq_len - min_length + 1, dtype=np.uint64)
+            for offset in range(min_length):
+                kmer_codes = (kmer_codes << np.uint64(2)) | base_codes[offset:offset + len(kmer_codes)]
+        
+        for length in range(min_length, 50):
+            if kmer_codes is not None:
+                if length > min_length:
+                    kmer_codes = (kmer_codes[:-1] << np.uint64(2)) | base_codes[length - 1:]
+                positions = np.asarray(candidates, dtype=np.intp)
+                positions = positions[positions < len(kmer_codes)]
+                _, inverse, counts = np.unique(kmer_codes[positions], return_inverse=True,
+                                               return_counts=True)
+                candidates = positions[counts[inverse] > 1].tolist()
+            
+            # Index every occurrence of each k-mer, in ascending position order
+            occurrences = {}
+            for pos in candidates:
+                if pos + length > seq_len:
+                    break
+                unit = sequence[pos:pos + length]
+                positions = occurrences.get(unit)
+                if positions is None:
+                    occurrences[unit] = [pos]
+                else:
+                    positions.append(pos)
+            
+            candidates = []
+            for unit, positions in occurrences.items():
+                if len(positions) < 2:
+                    continue
+                candidates.extend(positions)
                 
-                next_pos = sequence.find(repeat_unit, search_start, search_end)
-                if next_pos != -1:
-                    # Count consecutive repeats
-                    repeat_count = 1
-                    pos = next_pos
+                for i in positions:
+                    if i >= seq_len - length:
+                        break
+                    
+                    # Next occurrence that starts after the unit ends
+                    index = bisect_left(positions, i + length)
+                    if index == len(positions):
+                        break
+                    next_pos = positions[index]
+                    if next_pos + length > min(i + max_distance, seq_len):
+                        continue
                     
-                    while pos + length <= len(sequence):
-                        if sequence[pos:pos+length] == repeat_unit:
-                            repeat_count += 1
-                            pos += length
-                        else:
-                            break
+                    # Count consecutive repeats
+                    repeat_count = 2
+                    pos = next_pos + length
+                    while sequence.startswith(unit, pos):
+                        repeat_count += 1
+                        pos += length
                     
-                    if repeat_count >= 2:
-                        repeats.append({
-                            'start': i,
-                            'end': pos,
-                            'unit': repeat_unit,
-                            'unit_length': length,
-                            'copy_number': repeat_count + 1,
-                            'total_length': (repeat_count + 1) * length
-                        })
-        
-        # Remove overlapping repeats (keep longest)
-        repeats.sort(key=lambda x: x['total_length'], reverse=True)
+                    found.append((i, pos, unit, length, repeat_count))
+            
+            if not candidates:
+                break
+            candidates.sort()
+        
+        # Longest first; ties keep scan order (start, then unit length)
+        found.sort(key=lambda r: (-(r[4] + 1) * r[3], r[0], r[3]))
+        
+        # Keep longest non-overlapping repeats. Kept intervals are disjoint,
+        # so only the one starting closest before an interval's end can overlap it.
+        kept_starts = []
+        kept_ends = []
         filtered_repeats = []
         
-        for repeat in repeats:
-            overlaps = False
-            for existing in filtered_repeats:
-                if (repeat['start'] < existing['end'] and repeat['end'] > existing['start']):
-                    overlaps = True
-                    break
+        for start, end, unit, length, repeat_count in found:
+            index = bisect_left(kept_starts, end)
+            if index and kept_ends[index - 1] > start:
+                continue
             
-            if not overlaps:
-                filtered_repeats.append(repeat)
+            kept_starts.insert(index, start)
+            kept_ends.insert(index, end)
+            filtered_repeats.append({
+                'start': start,
+                'end': end,
+                'unit': unit,
+                'unit_length': length,
+                'copy_number': repeat_count + 1,
+                'total_length': (repeat_count + 1) * length
+            })
         
         return filtered_repeats
     
@@ -312,21 +825,36 @@ class SequenceTools:
         if total_length == 0:
             return {}
         
-        composition = Counter(sequence)
+        if np is not None and sequence.isascii():
+            # One vectorized histogram over the raw bytes
+            histogram = np.bincount(
+                np.frombuffer(sequence.encode('ascii'), dtype=np.uint8),
+                minlength=128
+            )
+            composition = {base: int(histogram[ord(base)]) for base in 'ATUGCN'}
+        else:
+            composition = Counter(sequence)
+        
+        a_count = composition.get('A', 0)
+        t_count = composition.get('T', 0) + composition.get('U', 0)
+        g_count = composition.get('G', 0)
+        c_count = composition.get('C', 0)
+        # Same value calculate_gc_content gives for the upper-cased sequence
+        gc_percent = ((g_count + c_count) / total_length) * 100
         
         return {
             'length': total_length,
-            'A_count': composition.get('A', 0),
-            'T_count': composition.get('T', 0) + composition.get('U', 0),
-            'G_count': composition.get('G', 0),
-            'C_count': composition.get('C', 0),
+            'A_count': a_count,
+            'T_count': t_count,
+            'G_count': g_count,
+            'C_count': c_count,
             'N_count': composition.get('N', 0),
-            'A_percent': (composition.get('A', 0) / total_length) * 100,
-            'T_percent': ((composition.get('T', 0) + composition.get('U', 0)) / total_length) * 100,
-            'G_percent': (composition.get('G', 0) / total_length) * 100,
-            'C_percent': (composition.get('C', 0) / total_length) * 100,
-            'GC_percent': SequenceTools.calculate_gc_content(sequence),
-            'AT_percent': 100 - SequenceTools.calculate_gc_content(sequence)
+            'A_percent': (a_count / total_length) * 100,
+            'T_percent': (t_count / total_length) * 100,
+            'G_percent': (g_count / total_length) * 100,
+            'C_percent': (c_count / total_length) * 100,
+            'GC_percent': gc_percent,
+            'AT_percent': 100 - gc_percent
         }
     
     @staticmethod
@@ -342,49 +870,28 @@ class SequenceTools:
             
         Returns:
             List of primer candidates
+            
+        Raises:
+            ValidationError: If the minimum primer length is less than 1
         """
         sequence = sequence.upper()
-        primers = []
         
         min_len, max_len = target_length
         min_tm, max_tm = target_tm
+        if min_len < 1:
+            raise ValidationError("Minimum primer length must be at least 1")
         
-        # Design forward primers
-        for start in range(min(100, len(sequence) - min_len)):
-            for length in range(min_len, min(max_len + 1, len(sequence) - start + 1)):
-                primer_seq = sequence[start:start + length]
-                tm = SequenceTools.calculate_melting_temperature(primer_seq)
-                gc = SequenceTools.calculate_gc_content(primer_seq)
-                
-                if min_tm <= tm <= max_tm and 40 <= gc <= 60:
-                    primers.append({
-                        'sequence': primer_seq,
-                        'start': start,
-                        'end': start + length,
-                        'length': length,
-                        'tm': tm,
-                        'gc_content': gc,
-                        'type': 'forward'
-                    })
-        
-        # Design reverse primers (from 3' end)
-        for end in range(len(sequence) - min_len, max(len(sequence) - 100, min_len - 1), -1):
-            for length in range(min_len, min(max_len + 1, end + 1)):
-                primer_seq = SequenceTools.reverse_complement(sequence[end - length:end])
-                tm = SequenceTools.calculate_melting_temperature(primer_seq)
-                gc = SequenceTools.calculate_gc_content(primer_seq)
-                
-                if min_tm <= tm <= max_tm and 40 <= gc <= 60:
-                    primers.append({
-                        'sequence': primer_seq,
-                        'start': end - length,
-                        'end': end,
-                        'length': length,
-                        'tm': tm,
-                        'gc_content': gc,
-                        'type': 'reverse'
-                    })
+        if np is not None and sequence.isascii():
+            primers = _primer_candidates_numpy(sequence, min_len, max_len, min_tm, max_tm)
+        else:
+            primers = _primer_candidates(sequence, min_len, max_len, min_tm, max_tm)
         
         # Sort by melting temperature
         primers.sort(key=lambda x: abs(x['tm'] - 60))  # Prefer Tm around 60°C
         return primers[:20]  # Return top 20 candidates
+
+
+if np is not None:
+    # Codon lookups for the built-in genetic codes are ready before the first call
+    for _code, _codon_table in SequenceTools.GENETIC_CODES.items():
+        SequenceTools._CODON_LUTS[_code] = _codon_lut(_codon_table)
@@ -5,11 +5,15 @@ Base HTTP client for NCBI E-utilities.
 import os
 import ssl
 import time
+import asyncio
 import logging
+import functools
+import threading
+import http.client
 import urllib.request
 import urllib.parse
 import urllib.error
-from typing import Dict, Any, Optional, Union, List
+from typing import IO, Dict, Any, Optional, Union, List, Tuple
 
 from ncbi_client.core.exceptions import NCBIError, RateLimitError, NetworkError, AuthenticationError
 from ncbi_client.core.rate_limiter import RateLimiter
@@ -27,6 +31,12 @@ from ncbi_client.utils.history import HistoryManager
 
 logger = logging.getLogger(__name__)
 
+# Idle keep-alive connections kept per client
+_MAX_IDLE_CONNECTIONS = 10
+
+# Redirects followed per request, as urllib does
+_MAX_REDIRECTS = 10
+
 
 class NCBIClient:
     """
@@ -38,6 +48,9 @@ class NCBIClient:
     
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
     
+    # Verified SSL context shared by clients that don't bring their own
+    _DEFAULT_SSL_CONTEXT: Optional[ssl.SSLContext] = None
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -76,7 +89,7 @@ class NCBIClient:
             logger.warning("SSL verification disabled. This is not recommended for production use.")
         elif self.ssl_context is None:
             # Use default verified SSL context
-            self.ssl_context = ssl.create_default_context()
+            self.ssl_context = NCBIClient._default_ssl_context()
         
         # Set up rate limiting based on API key availability
         if rate_limit is not None:
@@ -89,6 +102,16 @@ class NCBIClient:
         # Set up URL opener with proper headers
         self.opener = self._setup_opener()
         
+        # Requests reuse pooled keep-alive connections, unless a proxy is
+        # configured for the endpoint (then urllib handles them)
+        base_url = urllib.parse.urlsplit(self.BASE_URL)
+        self._keep_alive = not (
+            urllib.request.getproxies().get(base_url.scheme)
+            and not urllib.request.proxy_bypass(base_url.hostname)
+        )
+        self._idle_connections: List[http.client.HTTPConnection] = []
+        self._connections_lock = threading.Lock()
+        
         # Initialize history manager
         self.history = HistoryManager()
         
@@ -103,11 +126,22 @@ class NCBIClient:
         self.espell = ESpell(self)
         self.ecitmatch = ECitMatch(self)
     
+    @classmethod
+    def _default_ssl_context(cls) -> ssl.SSLContext:
+        """
+        Get the shared verified SSL context, loading the CA bundle on first use.
+        """
+        if NCBIClient._DEFAULT_SSL_CONTEXT is None:
+            NCBIClient._DEFAULT_SSL_CONTEXT = ssl.create_default_context()
+        return NCBIClient._DEFAULT_SSL_CONTEXT
+    
     def _setup_opener(self) -> urllib.request.OpenerDirector:
         """
         Create URL opener with proper headers and error handling.
         """
-        opener = urllib.request.build_opener()
+        # Hand over the client's SSL context so the default HTTPS handler
+        # doesn't load the CA bundle again
+        opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=self.ssl_context))
         
         # Set up default headers
         opener.addheaders = [
@@ -116,6 +150,100 @@ class NCBIClient:
         
         return opener
     
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """
+        Open a connection to the E-utilities host.
+        """
+        base_url = urllib.parse.urlsplit(self.BASE_URL)
+        if base_url.scheme == 'https':
+            return http.client.HTTPSConnection(base_url.netloc, timeout=30, context=self.ssl_context)
+        return http.client.HTTPConnection(base_url.netloc, timeout=30)
+    
+    def _send(
+        self,
+        req: urllib.request.Request
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """
+        Send a request over an idle pooled connection, or a new one.
+        
+        A pooled connection the server has closed since its last use is
+        dropped and the request sent once more.
+        """
+        url = urllib.parse.urlsplit(req.full_url)
+        target = f"{url.path}?{url.query}" if url.query else url.path
+        headers = dict(req.header_items())
+        
+        while True:
+            with self._connections_lock:
+                connection = self._idle_connections.pop() if self._idle_connections else None
+            reused = connection is not None
+            if connection is None:
+                connection = self._new_connection()
+            
+            try:
+                connection.request(req.get_method(), target, body=req.data, headers=headers)
+                return connection, connection.getresponse()
+            except (ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if not reused:
+                    raise
+            except Exception:
+                connection.close()
+                raise
+    
+    def _read_response(
+        self,
+        connection: http.client.HTTPConnection,
+        response: http.client.HTTPResponse
+    ) -> bytes:
+        """
+        Read a response body and return its connection to the pool.
+        """
+        try:
+            body = response.read()
+        except Exception:
+            connection.close()
+            raise
+        
+        # http.client closes the connection itself when the server asks to
+        if connection.sock is not None:
+            with self._connections_lock:
+                if len(self._idle_connections) < _MAX_IDLE_CONNECTIONS:
+                    self._idle_connections.append(connection)
+                    return body
+            connection.close()
+        return body
+    
+    def _redirect_request(
+        self,
+        req: urllib.request.Request,
+        response: http.client.HTTPResponse
+    ) -> urllib.request.Request:
+        """
+        Build the request a 3xx response redirects to.
+        
+        Follows urllib's rules: 307/308 keep the method and body, other
+        redirects turn a POST into a body-less GET.
+        
+        Raises:
+            urllib.error.HTTPError: If the response has no Location or a
+                POST cannot be redirected
+        """
+        location = response.headers.get('Location')
+        if not location or response.status not in (301, 302, 303, 307, 308):
+            raise urllib.error.HTTPError(
+                req.full_url, response.status, response.reason, response.headers, None
+            )
+        
+        url = urllib.parse.urljoin(req.full_url, location)
+        if response.status in (307, 308):
+            return urllib.request.Request(
+                url, data=req.data, headers=dict(req.header_items()), method=req.get_method()
+            )
+        
+        headers = {k: v for k, v in req.header_items() if k.lower() != 'content-type'}
+        return urllib.request.Request(url, headers=headers)
+    
     def _build_params(self, **kwargs) -> Dict[str, Any]:
         """
         Build request parameters with authentication.
@@ -139,18 +267,26 @@ class NCBIClient:
         self,
         endpoint: str,
         method: str = 'GET',
+        stream: bool = False,
+        raw: bool = False,
         **params
-    ) -> str:
+    ) -> Union[str, bytes, IO[bytes]]:
         """
         Make a request to NCBI E-utilities with rate limiting.
         
         Args:
             endpoint: E-utility endpoint (e.g., 'esearch.fcgi')
             method: HTTP method
-            **params: Request parameters
+            stream: Return the open binary response instead of reading it, so
+                large payloads can be consumed incrementally; the caller must
+                close it
+            raw: Return the undecoded response body as bytes, skipping the
+                UTF-8 decode for payloads written to disk or parsed as bytes
+            **params: Request parameters; list values are sent as repeated keys
             
         Returns:
-            Response text
+            Response text, the response bytes when raw, or the binary response
+            object when streaming
             
         Raises:
             RateLimitError: If rate limit is exceeded
@@ -165,29 +301,67 @@ class NCBIClient:
         
         # Build parameters
         request_params = self._build_params(**params)
+        headers = dict(self.opener.addheaders)
         
         try:
             logger.debug(f"Making {method} request to {url} with params: {request_params}")
             
             if method.upper() == 'GET':
                 if request_params:
-                    query_string = urllib.parse.urlencode(request_params)
+                    query_string = urllib.parse.urlencode(request_params, doseq=True)
                     url = f"{url}?{query_string}"
                 
-                # Create request with SSL context
-                req = urllib.request.Request(url)
-                with urllib.request.urlopen(req, timeout=30, context=self.ssl_context) as response:
-                    return response.read().decode('utf-8')
-                    
-            elif method.upper() == 'POST':
-                data = urllib.parse.urlencode(request_params).encode('utf-8')
-                req = urllib.request.Request(url, data=data, method='POST')
+                req = urllib.request.Request(url, headers=headers)
                 
-                with urllib.request.urlopen(req, timeout=30, context=self.ssl_context) as response:
-                    return response.read().decode('utf-8')
+            elif method.upper() == 'POST':
+                data = urllib.parse.urlencode(request_params, doseq=True).encode('utf-8')
+                headers['Content-Type'] = 'application/x-www-form-urlencoded'
+                req = urllib.request.Request(url, data=data, headers=headers, method='POST')
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
+            if self._keep_alive:
+                origin = urllib.parse.urlsplit(self.BASE_URL)[:2]
+                redirects = 0
+                while True:
+                    connection, response = self._send(req)
+                    if stream and response.status < 300:
+                        # Hand the socket over to the response: it really closes once
+                        # the caller closes the response
+                        if connection.sock is not None:
+                            connection.sock.close()
+                        return response
+                    
+                    body = self._read_response(connection, response)
+                    if response.status < 300:
+                        return body if raw else body.decode('utf-8')
+                    if response.status >= 400:
+                        raise urllib.error.HTTPError(
+                            url, response.status, response.reason, response.headers, None
+                        )
+                    if redirects == _MAX_REDIRECTS:
+                        raise urllib.error.HTTPError(
+                            url, response.status, "Too many redirects", response.headers, None
+                        )
+                    
+                    # A redirect is a new request, so it waits its turn too
+                    req = self._redirect_request(req, response)
+                    redirects += 1
+                    self.rate_limiter.wait_if_needed()
+                    if urllib.parse.urlsplit(req.full_url)[:2] != origin:
+                        # Only the E-utilities host is pooled; urllib takes
+                        # redirects to anywhere else
+                        break
+            
+            # Open request with SSL context
+            response = urllib.request.urlopen(req, timeout=30, context=self.ssl_context)
+            if stream:
+                return response
+            
+            with response:
+                body = response.read()
+            return body if raw else body.decode('utf-8')
+            
         except urllib.error.HTTPError as e:
             if e.code == 429:
                 raise RateLimitError("Rate limit exceeded")
@@ -195,7 +369,7 @@ class NCBIClient:
                 raise AuthenticationError("Invalid API key")
             else:
                 raise NetworkError(f"HTTP {e.code}: {e.reason}")
-        except urllib.error.URLError as e:
+        except (urllib.error.URLError, ssl.SSLCertVerificationError) as e:
             # Provide more helpful SSL error messages
             error_msg = str(e.reason)
             if "CERTIFICATE_VERIFY_FAILED" in error_msg:
@@ -209,6 +383,38 @@ class NCBIClient:
         except Exception as e:
             raise NetworkError(f"Request failed: {str(e)}")
     
+    async def arequest(
+        self,
+        endpoint: str,
+        method: str = 'GET',
+        **params
+    ) -> str:
+        """
+        Make a request to NCBI E-utilities without blocking the event loop.
+        
+        The request runs in the loop's default executor, so concurrent calls
+        overlap their network latency while sharing this client's rate limit
+        and keep-alive connections. Rate limiting happens in the worker right
+        before sending, so queued calls cannot burst past the limit.
+        
+        Args:
+            endpoint: E-utility endpoint (e.g., 'esearch.fcgi')
+            method: HTTP method
+            **params: Request parameters
+            
+        Returns:
+            Response text
+            
+        Raises:
+            RateLimitError: If rate limit is exceeded
+            NetworkError: If network request fails
+            AuthenticationError: If authentication fails
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.request, endpoint, method, **params)
+        )
+    
     def get_databases(self) -> List[str]:
         """
         Get list of available NCBI databases.
@@ -3,8 +3,8 @@ Rate limiting functionality for NCBI API requests.
 """
 
 import time
-from collections import deque
-from typing import Optional
+import threading
+from typing import List, Optional
 
 
 class RateLimiter:
@@ -26,30 +26,42 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests: deque = deque()
+        # Ring buffer of the last max_requests send times (time.monotonic());
+        # the slot at _index holds the oldest one
+        self._slots: List[float] = [float('-inf')] * max_requests
+        self._index = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def requests(self) -> List[float]:
+        """Send times (time.monotonic()) of the requests still inside the window, oldest first."""
+        cutoff = time.monotonic() - self.time_window
+        ordered = self._slots[self._index:] + self._slots[:self._index]
+        return [sent for sent in ordered if sent > cutoff]
     
     def wait_if_needed(self) -> None:
         """
         Wait if necessary to respect rate limits.
-        """
-        now = time.time()
         
-        # Remove requests outside the time window
-        while self.requests and self.requests[0] <= now - self.time_window:
-            self.requests.popleft()
+        Safe to call from several threads sharing one client; callers queue
+        on a lock so concurrent requests still honour the limit.
+        """
+        with self._lock:
+            self._wait_locked()
+    
+    def _wait_locked(self) -> None:
+        """Record a request, sleeping first if the window is full."""
+        now = time.monotonic()
         
-        # If we're at the limit, wait
-        if len(self.requests) >= self.max_requests:
-            sleep_time = self.time_window - (now - self.requests[0])
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-                # Clean up after waiting
-                now = time.time()
-                while self.requests and self.requests[0] <= now - self.time_window:
-                    self.requests.popleft()
+        # The request max_requests back must have left the window
+        sleep_time = self._slots[self._index] + self.time_window - now
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+            now = time.monotonic()
         
-        # Record this request
-        self.requests.append(now)
+        # Record this request over the oldest one
+        self._slots[self._index] = now
+        self._index = (self._index + 1) % self.max_requests
     
     def set_rate(self, max_requests: int) -> None:
         """
@@ -58,4 +70,10 @@ class RateLimiter:
         Args:
             max_requests: New maximum requests per time window
         """
-        self.max_requests = max_requests
+        with self._lock:
+            # Keep the most recent send times, oldest first
+            ordered = self._slots[self._index:] + self._slots[:self._index]
+            recent = ordered[max(len(ordered) - max_requests, 0):]
+            self._slots = [float('-inf')] * (max_requests - len(recent)) + recent
+            self._index = 0
+            self.max_requests = max_requests
@@ -6,12 +6,72 @@ gene annotations, and other genomic data.
 """
 
 import json
+import time
+import random
+import asyncio
+import functools
+import threading
+import http.client
 import urllib.request
 import urllib.parse
 import urllib.error
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
 from ncbi_client.core.base_client import NCBIClient
 from ncbi_client.core.exceptions import NCBIError, APIError
+from ncbi_client.utils.cache import MemoryCache
+
+try:
+    import orjson
+except ImportError:  # optional; the standard library decoder is used instead
+    orjson = None
+
+# Both decoders accept the raw response bytes and raise ValueError subclasses.
+_loads = orjson.loads if orjson is not None else json.loads
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Idle keep-alive connections kept per DatasetsAPI instance
+_MAX_IDLE_CONNECTIONS = 16
+
+# Identifiers per request for list lookups, keeping URLs well under the
+# server's length limit, and chunk requests run in parallel
+_BATCH_SIZE = 200
+_BATCH_WORKERS = 4
+
+# Responses worth retrying, and the longest wait between attempts in seconds
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRY_DELAY = 60.0
+
+# Templates of the ID-list endpoints, shared by the sync and async lookups
+_GENOME_SUMMARY_ENDPOINT = "genome/accession/{ids}"
+_GENOME_DOWNLOAD_ENDPOINT = "genome/accession/{ids}/download"
+_ASSEMBLY_REPORT_ENDPOINT = "genome/accession/{ids}/dataset_report"
+_GENE_DETAILS_ENDPOINT = "gene/id/{ids}"
+
+
+# Response fields counting records, which add up across chunks
+_COUNT_FIELDS = frozenset({'total_count'})
+
+
+def _merge_responses(responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge chunk responses in order.
+    
+    List fields are concatenated and count fields summed; other fields are
+    taken from the first response that has them.
+    """
+    merged: Dict[str, Any] = {}
+    for response in responses:
+        for key, value in response.items():
+            if key not in merged:
+                merged[key] = list(value) if isinstance(value, list) else value
+            elif isinstance(value, list) and isinstance(merged[key], list):
+                merged[key].extend(value)
+            elif key in _COUNT_FIELDS:
+                merged[key] = int(merged[key]) + int(value)
+    return merged
 
 
 class DatasetsAPI:
@@ -21,14 +81,126 @@ class DatasetsAPI:
     
     BASE_URL = "https://api.ncbi.nlm.nih.gov/datasets/v2alpha"
     
-    def __init__(self, ncbi_client: Optional[NCBIClient] = None):
+    def __init__(
+        self,
+        ncbi_client: Optional[NCBIClient] = None,
+        cache: bool = True,
+        cache_ttl: int = 3600,
+        cache_size: int = 1024,
+        max_retries: int = 5,
+        retry_backoff: float = 0.5
+    ):
         """
         Initialize Datasets API client.
         
         Args:
             ncbi_client: Optional NCBI client for rate limiting
+            cache: Whether to keep responses in memory for repeated lookups
+            cache_ttl: Time-to-live of cached responses in seconds
+            cache_size: Maximum number of cached responses
+            max_retries: Retries of rate-limited (429) or unavailable (5xx)
+                responses before giving up
+            retry_backoff: Base delay in seconds, doubled on every retry
+                unless the server sends Retry-After
         """
         self.ncbi_client = ncbi_client
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        
+        # Response bodies are cached rather than parsed data, so every call
+        # parses its own copy that callers are free to modify
+        self._cache = MemoryCache(max_size=cache_size, default_ttl=cache_ttl) if cache else None
+        self._cache_lock = threading.Lock()
+        
+        # Reuse the NCBI client's SSL context if there is one
+        if ncbi_client is not None and ncbi_client.ssl_context is not None:
+            self.ssl_context = ncbi_client.ssl_context
+        else:
+            self.ssl_context = NCBIClient._default_ssl_context()
+        
+        # Endpoints are appended to a prebuilt origin and base path, so no
+        # request URL has to be parsed again
+        base_url = urllib.parse.urlsplit(self.BASE_URL)
+        self._origin = f"{base_url.scheme}://{base_url.netloc}"
+        self._base_path = base_url.path.rstrip('/') + '/'
+        
+        # Requests reuse pooled keep-alive connections, unless a proxy is
+        # configured for the endpoint (then urllib handles them)
+        self._keep_alive = not (
+            urllib.request.getproxies().get(base_url.scheme)
+            and not urllib.request.proxy_bypass(base_url.hostname)
+        )
+        self._idle_connections: List[http.client.HTTPConnection] = []
+        self._connections_lock = threading.Lock()
+    
+    def __enter__(self) -> 'DatasetsAPI':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Close the pooled keep-alive connections.
+        """
+        with self._connections_lock:
+            connections, self._idle_connections = self._idle_connections, []
+        for connection in connections:
+            connection.close()
+    
+    def cache_clear(self) -> None:
+        """
+        Drop all cached responses.
+        """
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache.clear()
+    
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """
+        Open a connection to the Datasets API host.
+        """
+        base_url = urllib.parse.urlsplit(self._origin)
+        if base_url.scheme == 'https':
+            return http.client.HTTPSConnection(base_url.netloc, timeout=30, context=self.ssl_context)
+        return http.client.HTTPConnection(base_url.netloc, timeout=30)
+    
+    def _get(self, target: str) -> Tuple[http.client.HTTPResponse, bytes]:
+        """
+        GET a path and query over an idle pooled connection, or a new one.
+        
+        A pooled connection the server has closed since its last use is
+        dropped and the request sent once more. The connection goes back to
+        the pool once the body has been read.
+        """
+        while True:
+            with self._connections_lock:
+                connection = self._idle_connections.pop() if self._idle_connections else None
+            reused = connection is not None
+            if connection is None:
+                connection = self._new_connection()
+            
+            try:
+                connection.request('GET', target, headers={'Accept': 'application/json'})
+                response = connection.getresponse()
+                body = response.read()
+            except (ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if not reused:
+                    raise
+                continue
+            except Exception:
+                connection.close()
+                raise
+            
+            # http.client closes the connection itself when the server asks to
+            if connection.sock is not None:
+                with self._connections_lock:
+                    if len(self._idle_connections) < _MAX_IDLE_CONNECTIONS:
+                        self._idle_connections.append(connection)
+                        return response, body
+                connection.close()
+            return response, body
         
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -44,22 +216,190 @@ class DatasetsAPI:
         Raises:
             APIError: If request fails
         """
-        url = f"{self.BASE_URL}/{endpoint}"
-        
+        target = self._base_path + endpoint
         if params:
-            query_string = urllib.parse.urlencode(params)
-            url = f"{url}?{query_string}"
+            # doseq sends list values as repeated keys rather than their repr
+            target += '?' + urllib.parse.urlencode(params, doseq=True)
+        url = self._origin + target
+        
+        body = None
+        if self._cache is not None:
+            with self._cache_lock:
+                body = self._cache.get(url)
         
         try:
-            with urllib.request.urlopen(url) as response:
-                data = response.read().decode('utf-8')
-                return json.loads(data)
+            if body is not None:
+                return _loads(body)
+            
+            body = self._fetch_with_retries(url, target)
+            data = _loads(body)
         except urllib.error.HTTPError as e:
             raise APIError(f"Datasets API request failed: HTTP {e.code} - {e.reason}")
         except urllib.error.URLError as e:
             raise APIError(f"Datasets API request failed: {e.reason}")
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             raise APIError(f"Invalid JSON response: {e}")
+        except (http.client.HTTPException, OSError) as e:
+            raise APIError(f"Datasets API request failed: {e}")
+        
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache.set(url, body)
+        return data
+    
+    def _fetch_with_retries(self, url: str, target: str) -> bytes:
+        """
+        Fetch a response body, retrying 429 and 5xx responses with backoff.
+        
+        Args:
+            url: Full request URL
+            target: Path and query part of url
+            
+        Raises:
+            urllib.error.HTTPError: If the API returns an error status that
+                is not retried, or still fails after max_retries retries
+        """
+        attempt = 0
+        while True:
+            try:
+                return self._fetch(url, target)
+            except urllib.error.HTTPError as e:
+                if e.code not in _RETRY_STATUSES or attempt >= self.max_retries:
+                    raise
+                e.close()
+                time.sleep(self._retry_delay(e, attempt))
+                attempt += 1
+    
+    def _retry_delay(self, error: urllib.error.HTTPError, attempt: int) -> float:
+        """
+        Seconds to wait before retrying: the server's Retry-After when given
+        in seconds, otherwise exponential backoff with jitter.
+        """
+        retry_after = error.headers.get('Retry-After') if error.headers is not None else None
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), _MAX_RETRY_DELAY)
+            except ValueError:
+                pass  # an HTTP date; fall back to backoff
+        
+        delay = min(self.retry_backoff * 2 ** attempt, _MAX_RETRY_DELAY)
+        return delay + random.uniform(0, self.retry_backoff)
+    
+    def _fetch(self, url: str, target: str) -> bytes:
+        """
+        Fetch a response body, over a pooled connection where possible.
+        
+        Args:
+            url: Full request URL
+            target: Path and query part of url
+            
+        Raises:
+            urllib.error.HTTPError: If the API returns an error status
+        """
+        if self._keep_alive:
+            response, body = self._get(target)
+            if response.status < 300:
+                return body
+            if response.status >= 400:
+                raise urllib.error.HTTPError(
+                    url, response.status, response.reason, response.headers, None
+                )
+            # Redirects are left to urllib to follow
+        
+        with urllib.request.urlopen(url, context=self.ssl_context) as response:
+            return response.read()
+    
+    async def _amake_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Make an API request without blocking the event loop.
+        
+        The request runs in the loop's default executor over the pooled
+        keep-alive connections.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            
+        Returns:
+            JSON response data
+            
+        Raises:
+            APIError: If request fails
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self._make_request, endpoint, params)
+        )
+    
+    async def _abatch(
+        self,
+        endpoint: str,
+        ids: List[str],
+        chunk_size: int,
+        concurrency: int
+    ) -> Dict[str, Any]:
+        """
+        Fetch an accession-list endpoint in concurrent chunks.
+        
+        Args:
+            endpoint: Endpoint template with an ``{ids}`` placeholder
+            ids: Identifiers to look up
+            chunk_size: Identifiers per request
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            The chunk responses merged in order: list fields are concatenated,
+            total_count is summed, other fields are taken from the first
+            response
+            
+        Raises:
+            ValueError: If chunk_size or concurrency is not positive
+            APIError: If any request fails
+        """
+        if chunk_size < 1 or concurrency < 1:
+            raise ValueError("chunk_size and concurrency must be positive")
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(chunk: List[str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._amake_request(endpoint.format(ids=','.join(chunk)))
+        
+        responses = await asyncio.gather(*(
+            fetch(ids[i:i + chunk_size]) for i in range(0, len(ids), chunk_size)
+        ))
+        return _merge_responses(responses)
+    
+    def _batch(self, endpoint: str, ids: List[str]) -> Dict[str, Any]:
+        """
+        Fetch an accession-list endpoint, splitting long lists into chunks.
+        
+        Lists that fit in one request are fetched as is; longer ones are
+        fetched in parallel chunks and merged like the async batch methods.
+        
+        Args:
+            endpoint: Endpoint template with an ``{ids}`` placeholder
+            ids: Identifiers to look up
+            
+        Returns:
+            Response data, merged across chunks
+            
+        Raises:
+            APIError: If any request fails
+        """
+        if len(ids) <= _BATCH_SIZE:
+            return self._make_request(endpoint.format(ids=','.join(ids)))
+        
+        chunks = [ids[i:i + _BATCH_SIZE] for i in range(0, len(ids), _BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=min(_BATCH_WORKERS, len(chunks))) as executor:
+            responses = list(executor.map(
+                lambda chunk: self._make_request(endpoint.format(ids=','.join(chunk))), chunks
+            ))
+        return _merge_responses(responses)
     
     def search_genomes(self, taxon: str, filters: Optional[Dict] = None, 
                       page_size: int = 20) -> Dict[str, Any]:
@@ -94,8 +434,26 @@ class DatasetsAPI:
         Returns:
             Genome summary data
         """
-        accession_list = ','.join(accessions)
-        return self._make_request(f"genome/accession/{accession_list}")
+        return self._batch(_GENOME_SUMMARY_ENDPOINT, list(accessions))
+    
+    async def aget_genome_summary(
+        self,
+        accessions: List[str],
+        chunk_size: int = 50,
+        concurrency: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Get summary information for many genome assemblies concurrently.
+        
+        Args:
+            accessions: List of assembly accessions
+            chunk_size: Accessions per request
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Genome summary data, merged across requests
+        """
+        return await self._abatch(_GENOME_SUMMARY_ENDPOINT, list(accessions), chunk_size, concurrency)
     
     def download_genome(self, accessions: List[str], include_annotation: bool = False,
                        format_type: str = "fasta") -> Dict[str, Any]:
@@ -116,7 +474,7 @@ class DatasetsAPI:
             'filename': f"ncbi_dataset.{format_type}.zip"
         }
         
-        return self._make_request(f"genome/accession/{accession_list}/download", params)
+        return self._make_request(_GENOME_DOWNLOAD_ENDPOINT.format(ids=accession_list), params)
     
     def search_genes(self, gene_symbols: List[str], taxon: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -148,8 +506,26 @@ class DatasetsAPI:
         Returns:
             Detailed gene information
         """
-        gene_list = ','.join(map(str, gene_ids))
-        return self._make_request(f"gene/id/{gene_list}")
+        return self._batch(_GENE_DETAILS_ENDPOINT, [str(gene_id) for gene_id in gene_ids])
+    
+    async def aget_gene_details(
+        self,
+        gene_ids: List[int],
+        chunk_size: int = 50,
+        concurrency: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Get detailed information for many genes concurrently.
+        
+        Args:
+            gene_ids: List of Gene IDs
+            chunk_size: Gene IDs per request
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Detailed gene information, merged across requests
+        """
+        return await self._abatch(_GENE_DETAILS_ENDPOINT, [str(g) for g in gene_ids], chunk_size, concurrency)
     
     def search_virus_genomes(self, virus_name: str, filters: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -195,8 +571,26 @@ class DatasetsAPI:
         Returns:
             Assembly report data
         """
-        accession_list = ','.join(accessions)
-        return self._make_request(f"genome/accession/{accession_list}/dataset_report")
+        return self._batch(_ASSEMBLY_REPORT_ENDPOINT, list(accessions))
+    
+    async def aget_assembly_reports(
+        self,
+        accessions: List[str],
+        chunk_size: int = 50,
+        concurrency: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Get assembly reports for many genomes concurrently.
+        
+        Args:
+            accessions: List of assembly accessions
+            chunk_size: Accessions per request
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Assembly report data, merged across requests
+        """
+        return await self._abatch(_ASSEMBLY_REPORT_ENDPOINT, list(accessions), chunk_size, concurrency)
     
     def search_protein_clusters(self, protein_name: str, taxon: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -220,8 +614,13 @@ class DatasetsAPI:
 class GenomeAssembly:
     """
     Represents a genome assembly from NCBI Datasets.
+    
+    Only the response data is stored; fields are read from it on access,
+    which keeps large result sets small.
     """
     
+    __slots__ = ('data',)
+    
     def __init__(self, data: Dict[str, Any]):
         """
         Initialize from API response data.
@@ -230,10 +629,26 @@ class GenomeAssembly:
             data: Assembly data from API
         """
         self.data = data
-        self.accession = data.get('accession')
-        self.organism = data.get('organism', {})
-        self.assembly_info = data.get('assembly_info', {})
-        self.assembly_stats = data.get('assembly_stats', {})
+    
+    @property
+    def accession(self) -> Optional[str]:
+        """Get assembly accession."""
+        return self.data.get('accession')
+    
+    @property
+    def organism(self) -> Dict[str, Any]:
+        """Get organism data."""
+        return self.data.get('organism', {})
+    
+    @property
+    def assembly_info(self) -> Dict[str, Any]:
+        """Get assembly info data."""
+        return self.data.get('assembly_info', {})
+    
+    @property
+    def assembly_stats(self) -> Dict[str, Any]:
+        """Get assembly statistics data."""
+        return self.data.get('assembly_stats', {})
     
     @property
     def name(self) -> str:
@@ -282,13 +697,68 @@ class GenomeAssembly:
             'contig_count': self.contig_count,
             'scaffold_count': self.scaffold_count
         }
+    
+    @staticmethod
+    def records_to_columns(items: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Convert assembly records to columns, one list per to_dict() field.
+        
+        Each column is built in a single pass over the records, without
+        wrapping them, which suits filtering and aggregating large result sets.
+        
+        Args:
+            items: Assembly data from API
+            
+        Returns:
+            Dictionary mapping field names to column values
+        """
+        organisms = [item.get('organism', {}) for item in items]
+        infos = [item.get('assembly_info', {}) for item in items]
+        stats = [item.get('assembly_stats', {}) for item in items]
+        return {
+            'accession': [item.get('accession') for item in items],
+            'name': [info.get('assembly_name', '') for info in infos],
+            'level': [info.get('assembly_level', '') for info in infos],
+            'organism_name': [organism.get('organism_name', '') for organism in organisms],
+            'tax_id': [organism.get('tax_id') for organism in organisms],
+            'total_length': [stat.get('total_sequence_length') for stat in stats],
+            'contig_count': [stat.get('number_of_contigs') for stat in stats],
+            'scaffold_count': [stat.get('number_of_scaffolds') for stat in stats]
+        }
+    
+    @staticmethod
+    def records_to_frame(items: List[Dict[str, Any]]) -> 'pd.DataFrame':
+        """
+        Convert assembly records to a pandas DataFrame.
+        
+        Args:
+            items: Assembly data from API
+            
+        Returns:
+            DataFrame with one column per to_dict() field
+            
+        Raises:
+            ImportError: If pandas is not installed
+        """
+        # pandas is optional (installed with the 'data' extra) and slow to
+        # import, so it is only loaded here
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("records_to_frame requires pandas (install the 'data' extra)") from None
+        return pd.DataFrame(GenomeAssembly.records_to_columns(items))
 
 
 class Gene:
     """
     Represents a gene from NCBI Datasets.
+    
+    Only the response data is stored; fields are read from it on access,
+    which keeps large result sets small.
     """
     
+    __slots__ = ('data',)
+    
     def __init__(self, data: Dict[str, Any]):
         """
         Initialize from API response data.
@@ -297,9 +767,21 @@ class Gene:
             data: Gene data from API
         """
         self.data = data
-        self.gene_id = data.get('gene_id')
-        self.gene_info = data.get('gene', {})
-        self.genomic_regions = data.get('genomic_regions', [])
+    
+    @property
+    def gene_id(self) -> Optional[int]:
+        """Get Gene ID."""
+        return self.data.get('gene_id')
+    
+    @property
+    def gene_info(self) -> Dict[str, Any]:
+        """Get gene info data."""
+        return self.data.get('gene', {})
+    
+    @property
+    def genomic_regions(self) -> List[Dict[str, Any]]:
+        """Get genomic regions."""
+        return self.data.get('genomic_regions', [])
     
     @property
     def symbol(self) -> str:
@@ -336,3 +818,49 @@ class Gene:
             'tax_id': self.tax_id,
             'chromosomes': self.chromosomes
         }
+    
+    @staticmethod
+    def records_to_columns(items: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Convert gene records to columns, one list per to_dict() field.
+        
+        Args:
+            items: Gene data from API
+            
+        Returns:
+            Dictionary mapping field names to column values
+        """
+        infos = [item.get('gene', {}) for item in items]
+        return {
+            'gene_id': [item.get('gene_id') for item in items],
+            'symbol': [info.get('symbol', '') for info in infos],
+            'description': [info.get('description', '') for info in infos],
+            'type': [info.get('type', '') for info in infos],
+            'tax_id': [info.get('tax_id') for info in infos],
+            'chromosomes': [
+                [region.get('chromosome', '') for region in item.get('genomic_regions', [])]
+                for item in items
+            ]
+        }
+    
+    @staticmethod
+    def records_to_frame(items: List[Dict[str, Any]]) -> 'pd.DataFrame':
+        """
+        Convert gene records to a pandas DataFrame.
+        
+        Args:
+            items: Gene data from API
+            
+        Returns:
+            DataFrame with one column per to_dict() field
+            
+        Raises:
+            ImportError: If pandas is not installed
+        """
+        # pandas is optional (installed with the 'data' extra) and slow to
+        # import, so it is only loaded here
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("records_to_frame requires pandas (install the 'data' extra)") from None
+        return pd.DataFrame(Gene.records_to_columns(items))
@@ -5,6 +5,7 @@ Based on NCBI E-utilities documentation:
 https://eutils.ncbi.nlm.nih.gov/entrez/eutils/ecitmatch.cgi
 """
 
+from itertools import repeat
 from typing import List, Dict, Any
 
 from ncbi_client.core.exceptions import ValidationError
@@ -46,13 +47,14 @@ class ECitMatch:
         if not citations:
             raise ValidationError("Citation list cannot be empty")
         
-        # Validate citation format
-        for i, citation in enumerate(citations):
-            if citation.count('|') < 5:
-                raise ValidationError(
-                    f"Citation {i+1} has invalid format. "
-                    "Expected: journal|year|volume|page|author|key|"
-                )
+        # Validate citation format; the separators are counted in one C-level
+        # pass and the offending citation only looked up on failure
+        if min(map(str.count, citations, repeat('|'))) < 5:
+            i = next(i for i, citation in enumerate(citations) if citation.count('|') < 5)
+            raise ValidationError(
+                f"Citation {i+1} has invalid format. "
+                "Expected: journal|year|volume|page|author|key|"
+            )
         
         # Build parameters
         params = {
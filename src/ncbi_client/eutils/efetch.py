@@ -5,10 +5,15 @@ Based on NCBI E-utilities documentation:
 https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi
 """
 
-from typing import List, Optional, Union, Dict, Any
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Iterator, List, Optional, Union, Dict, Any
 
 from ncbi_client.core.exceptions import ValidationError
 
+# NCBI asks for POST once an ID list grows past about 200 UIDs
+_POST_ID_THRESHOLD = 200
+
 
 class EFetch:
     """
@@ -17,27 +22,28 @@ class EFetch:
     EFetch retrieves full records from NCBI databases in various formats.
     """
     
-    # Database-specific format mappings from NCBI documentation
+    # Database-specific format mappings from NCBI documentation (frozensets,
+    # so validation is a hash lookup)
     VALID_FORMATS = {
         'pubmed': {
-            'rettypes': ['abstract', 'citation', 'docsum', 'full', 'medline', 'uilist'],
-            'retmodes': ['xml', 'text', 'asn.1']
+            'rettypes': frozenset({'abstract', 'citation', 'docsum', 'full', 'medline', 'uilist'}),
+            'retmodes': frozenset({'xml', 'text', 'asn.1'})
         },
         'protein': {
-            'rettypes': ['fasta', 'seqid', 'acc', 'gb', 'gp', 'docsum', 'uilist'],
-            'retmodes': ['xml', 'text', 'asn.1']
+            'rettypes': frozenset({'fasta', 'seqid', 'acc', 'gb', 'gp', 'docsum', 'uilist'}),
+            'retmodes': frozenset({'xml', 'text', 'asn.1'})
         },
         'nucleotide': {
-            'rettypes': ['fasta', 'seqid', 'acc', 'gb', 'docsum', 'uilist'],
-            'retmodes': ['xml', 'text', 'asn.1']
+            'rettypes': frozenset({'fasta', 'seqid', 'acc', 'gb', 'docsum', 'uilist'}),
+            'retmodes': frozenset({'xml', 'text', 'asn.1'})
         },
         'nuccore': {
-            'rettypes': ['fasta', 'seqid', 'acc', 'gb', 'docsum', 'uilist'],
-            'retmodes': ['xml', 'text', 'asn.1']
+            'rettypes': frozenset({'fasta', 'seqid', 'acc', 'gb', 'docsum', 'uilist'}),
+            'retmodes': frozenset({'xml', 'text', 'asn.1'})
         },
         'gene': {
-            'rettypes': ['gene_table', 'docsum', 'uilist'],
-            'retmodes': ['xml', 'text', 'asn.1']
+            'rettypes': frozenset({'gene_table', 'docsum', 'uilist'}),
+            'retmodes': frozenset({'xml', 'text', 'asn.1'})
         }
     }
     
@@ -59,8 +65,9 @@ class EFetch:
         seq_start: Optional[int] = None,
         seq_stop: Optional[int] = None,
         complexity: Optional[int] = None,
+        raw: bool = False,
         **kwargs
-    ) -> str:
+    ) -> Union[str, bytes]:
         """
         Fetch records from NCBI database.
         
@@ -77,10 +84,12 @@ class EFetch:
             seq_start: Starting sequence position
             seq_stop: Ending sequence position
             complexity: Sequence complexity level
+            raw: Return the response as undecoded bytes, avoiding a full
+                decode of large sequence payloads
             **kwargs: Additional parameters
             
         Returns:
-            Response text in requested format
+            Response text in requested format, or bytes when raw
             
         Raises:
             ValidationError: If parameters are invalid
@@ -95,10 +104,13 @@ class EFetch:
             'retmode': retmode
         }
         
-        # Add ID list or history parameters
+        # Add ID list or history parameters; long lists go in a POST body
+        method = 'GET'
         if id_list:
             if isinstance(id_list, (list, tuple)):
-                params['id'] = ','.join(str(uid) for uid in id_list)
+                params['id'] = ','.join(map(str, id_list))
+                if len(id_list) > _POST_ID_THRESHOLD:
+                    method = 'POST'
             else:
                 params['id'] = str(id_list)
         
@@ -126,9 +138,16 @@ class EFetch:
         # Add any additional parameters
         params.update(kwargs)
         
-        # Make request
-        response = self.client.request('efetch.fcgi', **params)
-        return response
+        return self._do_fetch(params, raw, method)
+    
+    def _do_fetch(
+        self,
+        params: Dict[str, Any],
+        raw: bool = False,
+        method: str = 'GET'
+    ) -> Union[str, bytes]:
+        """Send an EFetch request with already validated parameters."""
+        return self.client.request('efetch.fcgi', method=method, raw=raw, **params)
     
     def fetch_by_ids(
         self,
@@ -137,7 +156,7 @@ class EFetch:
         rettype: str = 'docsum',
         retmode: str = 'xml',
         **kwargs
-    ) -> str:
+    ) -> Union[str, bytes]:
         """
         Fetch records by ID list.
         
@@ -146,10 +165,10 @@ class EFetch:
             ids: List of UIDs
             rettype: Retrieval type
             retmode: Retrieval mode
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (including raw)
             
         Returns:
-            Response text in requested format
+            Response text in requested format, or bytes when raw
         """
         return self.fetch(db=db, id_list=ids, rettype=rettype, retmode=retmode, **kwargs)
     
@@ -161,7 +180,7 @@ class EFetch:
         rettype: str = 'docsum',
         retmode: str = 'xml',
         **kwargs
-    ) -> str:
+    ) -> Union[str, bytes]:
         """
         Fetch records from history server.
         
@@ -171,10 +190,10 @@ class EFetch:
             query_key: Query key
             rettype: Retrieval type
             retmode: Retrieval mode
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (including raw)
             
         Returns:
-            Response text in requested format
+            Response text in requested format, or bytes when raw
         """
         return self.fetch(
             db=db,
@@ -193,11 +212,16 @@ class EFetch:
         batch_size: int = 500,
         rettype: str = 'docsum',
         retmode: str = 'xml',
-        max_records: Optional[int] = None
-    ) -> List[str]:
+        max_records: Optional[int] = None,
+        concurrency: int = 3,
+        raw: bool = False
+    ) -> List[Union[str, bytes]]:
         """
         Fetch large dataset in batches.
         
+        Holds every batch in memory; use iter_large_dataset or
+        fetch_large_dataset_to for dumps that should not.
+        
         Args:
             db: Database name
             webenv: Web environment
@@ -206,10 +230,60 @@ class EFetch:
             rettype: Retrieval type
             retmode: Retrieval mode
             max_records: Maximum total records to fetch
+            concurrency: Maximum number of batch requests in flight
+            raw: Return each batch as undecoded bytes
             
         Returns:
-            List of response texts (one per batch)
+            List of response texts, or bytes when raw (one per batch, in order)
+        """
+        return list(self.iter_large_dataset(
+            db, webenv, query_key,
+            batch_size=batch_size,
+            rettype=rettype,
+            retmode=retmode,
+            max_records=max_records,
+            concurrency=concurrency,
+            raw=raw
+        ))
+    
+    def iter_large_dataset(
+        self,
+        db: str,
+        webenv: str,
+        query_key: int,
+        batch_size: int = 500,
+        rettype: str = 'docsum',
+        retmode: str = 'xml',
+        max_records: Optional[int] = None,
+        concurrency: int = 3,
+        raw: bool = False
+    ) -> Iterator[Union[str, bytes]]:
         """
+        Fetch large dataset in batches, yielding each batch in order.
+        
+        Batches are fetched concurrently but still pass through the client's
+        shared rate limiter, so concurrency only fills the per-second budget
+        instead of exceeding it. At most concurrency batches are fetched
+        ahead of the consumer, so memory stays bounded by the batch size
+        rather than the dataset size.
+        
+        Args:
+            db: Database name
+            webenv: Web environment
+            query_key: Query key
+            batch_size: Number of records per batch
+            rettype: Retrieval type
+            retmode: Retrieval mode
+            max_records: Maximum total records to fetch
+            concurrency: Maximum number of batch requests in flight
+            raw: Yield each batch as undecoded bytes
+            
+        Yields:
+            Response text, or bytes when raw, for each batch
+        """
+        # Every batch shares these parameters, so they are validated once
+        self._validate_fetch_params(db, None, webenv, query_key, rettype, retmode)
+        
         # First, get the total count
         search_result = self.client.esearch.search(
             db=db,
@@ -222,24 +296,86 @@ class EFetch:
         if max_records:
             total_count = min(total_count, max_records)
         
+        base_params = {
+            'db': db,
+            'rettype': rettype,
+            'retmode': retmode,
+            'WebEnv': webenv,
+            'query_key': query_key
+        }
+        
         # Fetch in batches
-        results = []
-        for start in range(0, total_count, batch_size):
-            batch_max = min(batch_size, total_count - start)
+        def fetch_batch(start: int) -> Union[str, bytes]:
+            params = dict(base_params, retstart=start) if start > 0 else dict(base_params)
+            params['retmax'] = min(batch_size, total_count - start)
+            return self._do_fetch(params, raw)
+        
+        starts = range(0, total_count, batch_size)
+        if concurrency <= 1 or len(starts) <= 1:
+            for start in starts:
+                yield fetch_batch(start)
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(starts))) as executor:
+            pending: Deque[Future] = deque()
+            try:
+                for start in starts:
+                    pending.append(executor.submit(fetch_batch, start))
+                    if len(pending) >= concurrency:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                # Don't start batches nobody will consume
+                for future in pending:
+                    future.cancel()
+    
+    def fetch_large_dataset_to(
+        self,
+        path: str,
+        db: str,
+        webenv: str,
+        query_key: int,
+        batch_size: int = 500,
+        rettype: str = 'docsum',
+        retmode: str = 'xml',
+        max_records: Optional[int] = None,
+        concurrency: int = 3
+    ) -> int:
+        """
+        Fetch large dataset in batches, writing each batch to a file.
+        
+        Batches are written as raw bytes as they arrive, so neither the
+        whole dataset nor a decoded copy of any batch is held in memory.
+        
+        Args:
+            path: Output file path
+            db: Database name
+            webenv: Web environment
+            query_key: Query key
+            batch_size: Number of records per batch
+            rettype: Retrieval type
+            retmode: Retrieval mode
+            max_records: Maximum total records to fetch
+            concurrency: Maximum number of batch requests in flight
             
-            batch_result = self.fetch(
-                db=db,
-                webenv=webenv,
-                query_key=query_key,
-                retstart=start,
-                retmax=batch_max,
+        Returns:
+            Number of batches written
+        """
+        batches = 0
+        with open(path, 'wb') as handle:
+            for batch in self.iter_large_dataset(
+                db, webenv, query_key,
+                batch_size=batch_size,
                 rettype=rettype,
-                retmode=retmode
-            )
-            
-            results.append(batch_result)
-        
-        return results
+                retmode=retmode,
+                max_records=max_records,
+                concurrency=concurrency,
+                raw=True
+            ):
+                handle.write(batch)
+                batches += 1
+        return batches
     
     def _validate_fetch_params(
         self,
@@ -264,10 +400,10 @@ class EFetch:
             if rettype not in db_formats['rettypes']:
                 raise ValidationError(
                     f"Invalid rettype '{rettype}' for database '{db}'. "
-                    f"Valid options: {', '.join(db_formats['rettypes'])}"
+                    f"Valid options: {', '.join(sorted(db_formats['rettypes']))}"
                 )
             if retmode not in db_formats['retmodes']:
                 raise ValidationError(
                     f"Invalid retmode '{retmode}' for database '{db}'. "
-                    f"Valid options: {', '.join(db_formats['retmodes'])}"
+                    f"Valid options: {', '.join(sorted(db_formats['retmodes']))}"
                 )
@@ -5,10 +5,12 @@ Based on NCBI E-utilities documentation:
 https://eutils.ncbi.nlm.nih.gov/entrez/eutils/einfo.fcgi
 """
 
+import copy
 import xml.etree.ElementTree as ET
 from typing import List, Optional, Dict, Any
 
 from ncbi_client.core.exceptions import ValidationError, ParseError
+from ncbi_client.utils.cache import MemoryCache
 
 
 class EInfo:
@@ -18,9 +20,32 @@ class EInfo:
     EInfo provides database statistics and available search fields.
     """
     
-    def __init__(self, client):
-        """Initialize with reference to main client."""
+    def __init__(
+        self,
+        client,
+        cache: bool = True,
+        cache_ttl: int = 86400,
+        cache_size: int = 128
+    ):
+        """
+        Initialize with reference to main client.
+        
+        Args:
+            client: NCBIClient used to make requests
+            cache: Whether to keep parsed results in memory; EInfo data
+                changes at most once a day
+            cache_ttl: Time-to-live of cached results in seconds
+            cache_size: Maximum number of cached results
+        """
         self.client = client
+        self._cache = MemoryCache(max_size=cache_size, default_ttl=cache_ttl) if cache else None
+    
+    def cache_clear(self) -> None:
+        """
+        Drop all cached results.
+        """
+        if self._cache is not None:
+            self._cache.clear()
     
     def info(
         self,
@@ -57,14 +82,25 @@ class EInfo:
         # Add any additional parameters
         params.update(kwargs)
         
+        # Cached results are copied so callers are free to modify them
+        if self._cache is not None:
+            result = self._cache.get('einfo.fcgi', params)
+            if result is not None:
+                return copy.deepcopy(result)
+        
         # Make request
         response = self.client.request('einfo.fcgi', **params)
         
         # Parse response
         if version == "2.0":
-            return self._parse_info_v2_response(response)
+            result = self._parse_info_v2_response(response)
         else:
-            return self._parse_info_v1_response(response)
+            result = self._parse_info_v1_response(response)
+        
+        if self._cache is not None:
+            self._cache.set('einfo.fcgi', copy.deepcopy(result), params)
+        
+        return result
     
     def get_databases(self) -> List[str]:
         """
@@ -10,6 +10,9 @@ from typing import List, Union, Optional, Dict, Any
 
 from ncbi_client.core.exceptions import ValidationError, ParseError
 
+# NCBI asks for POST once an ID list grows past about 200 UIDs
+_POST_ID_THRESHOLD = 200
+
 
 class ELink:
     """
@@ -235,21 +238,12 @@ class ELink:
         """
         id_list = params.pop('id_list')
         
-        # Build URL manually for multiple &id parameters
-        base_params = params.copy()
-        
-        # Create parameter string with multiple &id entries
-        param_parts = []
-        for key, value in base_params.items():
-            param_parts.append(f"{key}={value}")
-        
-        for uid in id_list:
-            param_parts.append(f"id={uid}")
-        
-        # Make custom request
-        url = f"{self.client.BASE_URL}elink.fcgi"
-        response = self.client.session.get(url, params='&'.join(param_parts), timeout=30)
+        # A list value is sent as one id parameter per UID; long lists go in
+        # a POST body
+        params['id'] = [str(uid) for uid in id_list]
+        method = 'POST' if len(id_list) > _POST_ID_THRESHOLD else 'GET'
         
+        response = self.client.request('elink.fcgi', method=method, **params)
         return self._parse_link_response(response)
     
     def _validate_link_params(
@@ -336,11 +330,10 @@ class ELink:
                         'links': []
                     }
                     
-                    link_list = linksetdb.find('Link')
-                    if link_list is not None:
-                        db_links['links'] = [
-                            link.findtext('Id') for link in link_list.findall('Id')
-                        ]
+                    # One <Link><Id>...</Id></Link> per linked UID
+                    db_links['links'] = [
+                        link.findtext('Id') for link in linksetdb.findall('Link')
+                    ]
                     
                     linkset_data['linksetdbs'].append(db_links)
                 
@@ -6,10 +6,14 @@ https://eutils.ncbi.nlm.nih.gov/entrez/eutils/epost.fcgi
 """
 
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union, Optional, Dict, Any
 
 from ncbi_client.core.exceptions import ValidationError, ParseError
 
+# NCBI asks for POST once an ID list grows past about 200 UIDs
+_POST_ID_THRESHOLD = 200
+
 
 class EPost:
     """
@@ -52,7 +56,7 @@ class EPost:
         # Build parameters
         params = {
             'db': db,
-            'id': ','.join(str(uid) for uid in id_list)
+            'id': ','.join(map(str, id_list))
         }
         
         # Add existing web environment if provided
@@ -62,8 +66,9 @@ class EPost:
         # Add any additional parameters
         params.update(kwargs)
         
-        # Make request
-        response = self.client.request('epost.fcgi', **params)
+        # Make request; long ID lists go in a POST body
+        method = 'POST' if len(id_list) > _POST_ID_THRESHOLD else 'GET'
+        response = self.client.request('epost.fcgi', method=method, **params)
         
         # Parse response
         return self._parse_post_response(response)
@@ -101,38 +106,61 @@ class EPost:
         db: str,
         id_list: List[Union[str, int]],
         batch_size: int = 8000,
+        concurrency: int = 1,
         **kwargs
     ) -> List[Dict[str, Any]]:
         """
         Upload large lists of UIDs in batches.
         
-        NCBI recommends batches of ~8000 UIDs for EPost.
+        NCBI recommends batches of ~8000 UIDs for EPost. Every batch is added
+        to the WebEnv returned for the first one. With concurrency above 1 the
+        first batch is uploaded alone and the rest go up in parallel; requests
+        still pass through the client's shared rate limiter, so concurrency
+        only fills the per-second budget instead of exceeding it.
         
         Args:
             db: Database name
             id_list: List of UIDs to upload
             batch_size: Number of UIDs per batch
+            concurrency: Maximum number of batch uploads in flight
             **kwargs: Additional parameters
             
         Returns:
-            List of dictionaries containing WebEnv and QueryKey for each batch
+            List of dictionaries containing WebEnv and QueryKey for each batch,
+            in batch order
         """
         if not id_list:
             raise ValidationError("ID list cannot be empty")
         
-        results = []
-        webenv = None
+        batches = [
+            id_list[i:i + batch_size] for i in range(0, len(id_list), batch_size)
+        ]
         
-        # Process in batches
-        for i in range(0, len(id_list), batch_size):
-            batch = id_list[i:i + batch_size]
-            
-            # Upload batch
-            result = self.post(db=db, id_list=batch, webenv=webenv, **kwargs)
-            results.append(result)
-            
-            # Use the returned WebEnv for subsequent batches
-            webenv = result.get('webenv')
+        # The first batch creates the WebEnv the others are added to
+        results = [self.post(db=db, id_list=batches[0], **kwargs)]
+        webenv = results[0].get('webenv')
+        
+        if concurrency <= 1 or len(batches) <= 2:
+            for batch in batches[1:]:
+                result = self.post(db=db, id_list=batch, webenv=webenv, **kwargs)
+                results.append(result)
+                
+                # Use the returned WebEnv for subsequent batches
+                webenv = result.get('webenv')
+            return results
+        
+        def post_batch(batch: List[Union[str, int]]) -> Dict[str, Any]:
+            return self.post(db=db, id_list=batch, webenv=webenv, **kwargs)
+        
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(batches) - 1)) as executor:
+            results.extend(executor.map(post_batch, batches[1:]))
+        
+        # Uploads finish in any order; leave the history pointing at the last batch
+        last = results[-1]
+        if last.get('webenv'):
+            self.client.history.webenv = last['webenv']
+        if last.get('query_key') is not None:
+            self.client.history.query_key = last['query_key']
         
         return results
     
@@ -207,9 +235,9 @@ class EPost:
                 self.client.history.webenv = webenv
             
             if query_key:
-                result['query_key'] = int(query_key)
+                result['query_key'] = query_key = int(query_key)
                 # Store in client history
-                self.client.history.query_key = int(query_key)
+                self.client.history.query_key = query_key
             
             return result
             
@@ -69,7 +69,7 @@ class ESummary:
         # Add ID list or history parameters
         if id_list:
             if isinstance(id_list, (list, tuple)):
-                params['id'] = ','.join(str(uid) for uid in id_list)
+                params['id'] = ','.join(map(str, id_list))
             else:
                 params['id'] = str(id_list)
         
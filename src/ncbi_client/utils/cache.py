@@ -414,11 +414,12 @@ class MemoryCache:
         
         cache_key = self._get_cache_key(url, params)
         
+        # Re-insert updated keys so dict order stays oldest-first
+        self.cache.pop(cache_key, None)
+        
         # Remove oldest entries if cache is full
         if len(self.cache) >= self.max_size:
-            oldest_key = min(self.cache.keys(), 
-                           key=lambda k: self.cache[k]['cached_at'])
-            del self.cache[oldest_key]
+            del self.cache[next(iter(self.cache))]
         
         self.cache[cache_key] = {
             'data': data,
@@ -343,6 +343,21 @@ class DataHelpers:
         """
         return [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
     
+    @staticmethod
+    def parse_id_list(ids: str) -> List[str]:
+        """
+        Parse a comma-separated ID string such as "123, 456,789".
+        
+        Whitespace around each ID is stripped and empty entries are dropped.
+        
+        Args:
+            ids: Comma-separated IDs
+            
+        Returns:
+            List of IDs
+        """
+        return [uid for uid in map(str.strip, ids.split(',')) if uid]
+    
     @staticmethod
     def flatten_list(nested_list: List[List[Any]]) -> List[Any]:
         """
@@ -368,11 +383,15 @@ class DataHelpers:
         Returns:
             List without duplicates
         """
+        if key_func is None:
+            # dict preserves insertion order, so this de-duplicates in one C-level pass
+            return list(dict.fromkeys(data))
+        
         seen = set()
         result = []
         
         for item in data:
-            key = key_func(item) if key_func else item
+            key = key_func(item)
             
             if key not in seen:
                 seen.add(key)
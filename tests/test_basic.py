@@ -96,6 +96,72 @@ class TestEFetch:
             client.efetch.fetch(db="pubmed")
 
 
+class TestELink:
+    """Test ELink response parsing."""
+    
+    def test_parse_linked_ids(self):
+        """Test that every linked UID is extracted."""
+        client = NCBIClient()
+        
+        result = client.elink._parse_link_response(
+            "<eLinkResult><LinkSet><DbFrom>pubmed</DbFrom><IdList><Id>1</Id></IdList>"
+            "<LinkSetDb><DbTo>pubmed</DbTo><LinkName>pubmed_pubmed</LinkName>"
+            "<Link><Id>10</Id></Link><Link><Id>11</Id></Link></LinkSetDb>"
+            "</LinkSet></eLinkResult>"
+        )
+        
+        linkset = result['linksets'][0]
+        assert linkset['ids'] == ['1']
+        assert linkset['linksetdbs'][0]['links'] == ['10', '11']
+
+
+class TestEInfo:
+    """Test EInfo result caching."""
+    
+    def test_repeated_calls_are_cached(self):
+        """Test that repeated lookups for one database make one request."""
+        client = NCBIClient()
+        client.request = Mock(return_value=(
+            "<eInfoResult><DbInfo><DbName>pubmed</DbName><Count>5</Count>"
+            "<FieldList><Field><Name>ALL</Name></Field></FieldList>"
+            "<LinkList><Link><Name>pubmed_gene</Name></Link></LinkList>"
+            "</DbInfo></eInfoResult>"
+        ))
+        
+        fields = client.einfo.get_search_fields("pubmed")
+        fields.clear()
+        links = client.einfo.get_links("pubmed")
+        
+        assert client.request.call_count == 1
+        assert client.einfo.get_search_fields("pubmed")[0]['name'] == 'ALL'
+        assert links[0]['name'] == 'pubmed_gene'
+
+
+class TestDatasetsAPI:
+    """Test Datasets API chunked requests."""
+    
+    def test_chunked_responses_are_merged(self):
+        """Test that chunks concatenate reports and sum total_count."""
+        from ncbi_client.datasets.datasets_api import DatasetsAPI
+        
+        def make_request(endpoint):
+            accessions = endpoint.split('/')[2].split(',')
+            return {
+                'reports': [{'accession': acc} for acc in accessions],
+                'total_count': len(accessions)
+            }
+        
+        api = DatasetsAPI(cache=False)
+        api._make_request = Mock(side_effect=make_request)
+        accessions = [f"GCF_{i:09d}.1" for i in range(450)]
+        
+        result = api.get_genome_summary(accessions)
+        
+        assert api._make_request.call_count == 3
+        assert [report['accession'] for report in result['reports']] == accessions
+        assert result['total_count'] == 450
+
+
 class TestRateLimiter:
     """Test rate limiting functionality."""
     
@@ -167,5 +233,148 @@ class TestHistoryManager:
         assert combined == "#1 OR #2 OR #3"
 
 
+class TestSequenceTools:
+    """Test sequence analysis helpers."""
+    
+    def test_reverse_complement(self):
+        """Test reverse complement including ambiguity codes."""
+        from ncbi_client.converters.sequence_tools import SequenceTools
+        
+        assert SequenceTools.reverse_complement("ATGCatgc") == "gcatGCAT"
+        assert SequenceTools.reverse_complement("RYKMBVDHN") == "NDHBVKMRY"
+        assert SequenceTools.reverse_complement("rykmbvdhn") == "ndhbvkmry"
+        assert SequenceTools.reverse_complement("AXT") == "AXT"
+    
+    def test_analyze_composition(self):
+        """Test nucleotide composition counts."""
+        from ncbi_client.converters.sequence_tools import SequenceTools
+        
+        composition = SequenceTools.analyze_composition("AAUTGGCn")
+        assert composition['length'] == 8
+        assert composition['A_count'] == 2
+        assert composition['T_count'] == 2
+        assert composition['G_count'] == 2
+        assert composition['C_count'] == 1
+        assert composition['N_count'] == 1
+        assert composition['GC_percent'] == 37.5
+
+
+class TestFormatConverter:
+    """Test format conversion helpers."""
+    
+    @staticmethod
+    def _gbseq(accession, definition, sequence, version=None):
+        """Build one GBSeq element."""
+        parts = ["<GBSeq>"]
+        if accession is not None:
+            parts.append(f"<GBSeq_primary-accession>{accession}</GBSeq_primary-accession>")
+        if version is not None:
+            parts.append(f"<GBSeq_accession-version>{version}</GBSeq_accession-version>")
+        parts.append(f"<GBSeq_definition>{definition}</GBSeq_definition>")
+        parts.append(f"<GBSeq_sequence>{sequence}</GBSeq_sequence>")
+        parts.append("</GBSeq>")
+        return ''.join(parts)
+    
+    def _assert_paths_agree(self, xml, fast):
+        """Check the regex fast path (str) against the iterparse path (bytes)."""
+        from ncbi_client.converters.format_converter import FormatConverter, _single_gbseq_record
+        
+        assert (_single_gbseq_record(xml) is not None) == fast
+        converted = FormatConverter.xml_to_fasta(xml)
+        assert converted == FormatConverter.xml_to_fasta(xml.encode('utf-8'))
+        return converted
+    
+    def test_xml_to_fasta_single_record(self):
+        """Test a plain one-record GBSet."""
+        xml = (
+            '<?xml version="1.0"?>\n<GBSet>'
+            + self._gbseq("NM_000001", "Test gene", "acgt" * 20)
+            + '</GBSet>\n'
+        )
+        
+        converted = self._assert_paths_agree(xml, fast=True)
+        assert converted == ">NM_000001 Test gene\n" + "acgt" * 17 + "ac\n" + "gtacgtacgt"
+    
+    def test_xml_to_fasta_escaped_text(self):
+        """Test that entities and CDATA fall back to the parser."""
+        entity = '<GBSet>' + self._gbseq("X1", "Alpha &amp; beta", "acgt") + '</GBSet>'
+        cdata = '<GBSet>' + self._gbseq("X2", "Gamma", "<![CDATA[acgt]]>") + '</GBSet>'
+        
+        assert self._assert_paths_agree(entity, fast=False) == ">X1 Alpha & beta\nacgt"
+        assert self._assert_paths_agree(cdata, fast=False) == ">X2 Gamma\nacgt"
+    
+    def test_xml_to_fasta_accession_version_fallback(self):
+        """Test that records without a primary accession use accession-version."""
+        xml = '<GBSet>' + self._gbseq(None, "No primary", "acgt", version="AB000001.1") + '</GBSet>'
+        
+        assert self._assert_paths_agree(xml, fast=True) == ">AB000001.1 No primary\nacgt"
+    
+    def test_xml_to_fasta_two_records(self):
+        """Test that multi-record sets use the parser."""
+        xml = (
+            '<GBSet>'
+            + self._gbseq("X1", "First", "acgt")
+            + self._gbseq("X2", "Second", "ttgg")
+            + '</GBSet>'
+        )
+        
+        assert self._assert_paths_agree(xml, fast=False) == ">X1 First\nacgt\n>X2 Second\nttgg"
+
+
+class TestDataHelpers:
+    """Test data processing helpers."""
+    
+    def test_parse_id_list(self):
+        """Test parsing comma-separated ID strings."""
+        from ncbi_client.utils.helpers import DataHelpers
+        
+        assert DataHelpers.parse_id_list(" 123, 456 ,789,\n") == ["123", "456", "789"]
+        assert DataHelpers.parse_id_list("") == []
+        # Interior whitespace is kept rather than merging two tokens into one ID
+        assert DataHelpers.parse_id_list("12 34,56") == ["12 34", "56"]
+
+
+class TestCLIBatching:
+    """Test that batched CLI requests match unbatched ones."""
+    
+    @staticmethod
+    def _invoke(*args):
+        click_testing = pytest.importorskip("click.testing")
+        from ncbi_client import cli
+        
+        client = Mock()
+        client.esummary.summary.side_effect = lambda db, id_list, version: {
+            'docsums': [{'uid': uid} for uid in id_list],
+            'version': version,
+            'db': db
+        }
+        client.efetch.fetch.side_effect = lambda db, id_list, rettype, retmode: ''.join(
+            f">{uid}\nACGT\n" for uid in id_list
+        )
+        with patch.object(cli, '_get_client', return_value=client):
+            return click_testing.CliRunner().invoke(cli.cli, list(args))
+    
+    def test_batched_summary_matches_unbatched(self):
+        """Test that merged summary batches keep every field."""
+        unbatched = self._invoke('summary', 'pubmed', '1,2,3,4,5')
+        batched = self._invoke('summary', 'pubmed', '1,2,3,4,5', '--batch-size', '2')
+        
+        assert unbatched.exit_code == 0
+        assert batched.output == unbatched.output
+    
+    def test_batched_fetch(self):
+        """Test that text fetches concatenate and XML fetches refuse to batch."""
+        args = ('fetch', 'nuccore', '1,2,3', '--retmode', 'text')
+        unbatched = self._invoke(*args)
+        batched = self._invoke(*args, '--batch-size', '1')
+        
+        assert unbatched.exit_code == 0
+        assert batched.output == unbatched.output
+        
+        result = self._invoke('fetch', 'nuccore', '1,2,3', '--batch-size', '1')
+        assert result.exit_code != 0
+        assert 'batching requires --retmode text' in result.output
+
+
 if __name__ == "__main__":
     pytest.main([__file__])